@@ -328,6 +328,7 @@ class TradingLoop:
                     continue
 
                 # Full pipeline for each symbol
+                self._prequalify_symbols(self.symbols)
                 for symbol in self.symbols:
                     self._execute_pipeline_for_symbol(symbol)
 
@@ -349,6 +350,22 @@ class TradingLoop:
             and self._risk_engine is not None
         )
 
+    def _prequalify_symbols(self, symbols: List[str]) -> None:
+        """
+        Qualify a set of symbols in one batched Gateway round-trip.
+
+        Warms the ContractManager cache so the per-symbol qualify_contract
+        calls that follow are cache hits. A batch failure is only logged;
+        the per-symbol path then qualifies individually and records its own
+        error outcome.
+        """
+        if not symbols or self._contract_manager is None:
+            return
+        try:
+            self._contract_manager.qualify_contracts(symbols)
+        except Exception as exc:
+            logger.warning("Batch contract qualification failed for %s: %s", symbols, exc)
+
     def _execute_pipeline_for_symbol(self, symbol: str) -> None:
         """
         Run the full Market Data → Signal → Risk → Order pipeline for one symbol.
@@ -788,6 +805,8 @@ class TradingLoop:
         if not positions:
             return
 
+        if self._market_data_provider is not None:
+            self._prequalify_symbols([position.symbol for position in positions])
         for position in positions:
             try:
                 current_price = self._fetch_current_price(position.symbol)
@@ -8,8 +8,9 @@ ALPHA LEARNINGS ENFORCED:
 - Timeout parameter propagation
 """
 
-import time
 import logging
+import random
+import time
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -38,7 +39,8 @@ class IBKRConnection:
         client_id: Optional[int] = None,
         timeout: int = 30,
         max_retries: int = 3,
-        retry_delay_base: float = 2.0,
+        retry_delay_base: float = 1.0,
+        retry_delay_max: float = 30.0,
     ):
         """
         Initialize connection parameters.
@@ -49,7 +51,10 @@ class IBKRConnection:
             client_id: Unique client ID (auto-generated if None)
             timeout: Connection timeout in seconds
             max_retries: Maximum retry attempts on failure
-            retry_delay_base: Base delay for exponential backoff (2^n * base)
+            retry_delay_base: Base delay for exponential backoff (2^n * base).
+                Defaults to 1.0 (previously 2.0); with jitter the first retry
+                now waits 0.5-1s and the second 1-2s, versus 1s and 2s before.
+            retry_delay_max: Upper bound on any single backoff delay
         """
         self.host = host
         self.port = port
@@ -57,6 +62,7 @@ class IBKRConnection:
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay_base = retry_delay_base
+        self.retry_delay_max = retry_delay_max
 
         self._ib: Optional[IB] = None
         self._connection_start_time: Optional[datetime] = None
@@ -78,7 +84,8 @@ class IBKRConnection:
 
         Implementation Notes:
             - Generate unique ClientId if not provided (timestamp-based)
-            - Implement exponential backoff: delay = retry_delay_base ** attempt
+            - Implement exponential backoff: delay = retry_delay_base * 2 ** attempt,
+              capped at retry_delay_max, with jitter (see _retry_delay)
             - Track connection attempts for monitoring
         """
         if self._ib is None:
@@ -107,7 +114,7 @@ class IBKRConnection:
 
                 # If not last attempt, apply exponential backoff
                 if attempt < self.max_retries - 1:
-                    delay = self.retry_delay_base**attempt
+                    delay = self._retry_delay(attempt)
                     logger.info(f"Retrying in {delay:.1f} seconds...")
                     time.sleep(delay)
                 else:
@@ -119,6 +126,24 @@ class IBKRConnection:
 
         return False
 
+    def _retry_delay(self, attempt: int) -> float:
+        """
+        Backoff delay before retrying after a failed attempt.
+
+        Uses "equal jitter": half the capped exponential delay is fixed and
+        half is random, so bot processes restarted by the same Gateway outage
+        spread their reconnects out instead of retrying in lockstep.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+
+        Returns:
+            Delay in seconds, between half and all of
+            min(retry_delay_base * 2 ** attempt, retry_delay_max)
+        """
+        capped = min(self.retry_delay_base * 2.0**attempt, self.retry_delay_max)
+        return capped / 2 + random.uniform(0, capped / 2)
+
     def disconnect(self) -> None:
         """
         Cleanly disconnect from Gateway.
@@ -7,7 +7,7 @@ ALPHA LEARNING ENFORCED:
 """
 
 import logging
-from typing import Dict
+from typing import Dict, Iterable, List
 
 from ib_insync import Contract, Stock
 
@@ -124,6 +124,73 @@ class ContractManager:
             logger.error(f"Contract qualification failed for {symbol}: {type(e).__name__}: {e}")
             raise ContractQualificationError(f"Failed to qualify contract '{symbol}': {e}") from e
 
+    def qualify_contracts(
+        self,
+        symbols: Iterable[str],
+        exchange: str = "SMART",
+        currency: str = "USD",
+    ) -> Dict[str, Contract]:
+        """
+        Qualify several stock contracts in a single Gateway round-trip.
+
+        Cached symbols are served from the cache; the rest are passed together
+        to one ``qualifyContracts`` call, which ib_insync issues concurrently,
+        rather than one blocking request per symbol.
+
+        Args:
+            symbols: Ticker symbols (e.g., ["SPY", "QQQ", "IWM"])
+            exchange: Exchange (SMART for auto-routing)
+            currency: Currency code
+
+        Returns:
+            Dict mapping each symbol to its qualified Contract, in input order
+
+        Raises:
+            ContractQualificationError: If any symbol fails to qualify
+            TimeoutError: If qualification times out
+        """
+        symbols = list(dict.fromkeys(symbols))
+        qualified: Dict[str, Contract] = {}
+        pending: List[Contract] = []
+
+        for symbol in symbols:
+            cache_key = f"{symbol}_STK_{exchange}_{currency}"
+            if cache_key in self._qualified_cache:
+                qualified[symbol] = self._qualified_cache[cache_key]
+            else:
+                pending.append(Stock(symbol, exchange, currency))
+
+        if pending:
+            pending_symbols = [contract.symbol for contract in pending]
+            logger.info(f"Qualifying {len(pending)} contracts: {', '.join(pending_symbols)}")
+
+            try:
+                results = self.connection.ib.qualifyContracts(*pending)
+            except TimeoutError as e:
+                logger.error(f"Contract qualification timeout for {pending_symbols}: {e}")
+                raise
+            except Exception as e:
+                logger.error(
+                    f"Contract qualification failed for {pending_symbols}: "
+                    f"{type(e).__name__}: {e}"
+                )
+                raise ContractQualificationError(
+                    f"Failed to qualify contracts {pending_symbols}: {e}"
+                ) from e
+
+            for contract in results:
+                if getattr(contract, "conId", 0) > 0:
+                    qualified[contract.symbol] = contract
+                    self._qualified_cache[f"{contract.symbol}_STK_{exchange}_{currency}"] = contract
+
+            missing = [symbol for symbol in pending_symbols if symbol not in qualified]
+            if missing:
+                raise ContractQualificationError(
+                    f"Contract qualification failed for {missing} - no conId assigned"
+                )
+
+        return {symbol: qualified[symbol] for symbol in symbols}
+
     def is_qualified(self, contract: Contract) -> bool:
         """
         Check if contract is qualified.
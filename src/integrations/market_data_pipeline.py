@@ -12,8 +12,11 @@ ALPHA LEARNINGS ENFORCED:
 """
 
 import logging
+import math
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any, Dict, List
 
 import numpy as np
@@ -102,6 +105,69 @@ class AlphaLearningViolationError(Exception):
     pass
 
 
+# =============================================================================
+# BAR COLUMN EXTRACTION
+# =============================================================================
+
+_BAR_COLUMN_KEYS = ("close", "high", "low", "volume")
+_BAR_COLUMNS = tuple(itemgetter(key) for key in _BAR_COLUMN_KEYS)
+
+
+def _bars_to_columns(
+    bars: List[Dict[str, Any]],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert row-oriented bar dicts into contiguous float64 columns.
+
+    Args:
+        bars: List of bar dicts with OHLCV data
+
+    Returns:
+        Tuple of (closes, highs, lows, volumes) arrays
+
+    Raises:
+        InsufficientDataError: A bar has a missing (None) or NaN OHLCV value
+    """
+    n = len(bars)
+    columns = [np.fromiter(map(getter, bars), dtype=np.float64, count=n) for getter in _BAR_COLUMNS]
+    # np.fromiter turns None into NaN, which would flow silently into every indicator
+    for key, column in zip(_BAR_COLUMN_KEYS, columns):
+        bad = np.flatnonzero(np.isnan(column))
+        if bad.size:
+            raise InsufficientDataError(f"Bar {bad[0]} has missing {key} value")
+    closes, highs, lows, volumes = columns
+    return closes, highs, lows, volumes
+
+
+# =============================================================================
+# INDICATOR WEIGHTS
+# =============================================================================
+
+
+@lru_cache(maxsize=32)
+def _ema_weights(period: int, n: int) -> np.ndarray:
+    """
+    Weights that evaluate an n-bar EMA as a single dot product.
+
+    Closed form of the recurrence ema = a*p + (1-a)*ema seeded at prices[0]:
+    the seed carries weight (1-a)^(n-1), bar i carries a*(1-a)^(n-1-i).
+    Periods and window lengths repeat every fetch, so the vectors are cached
+    and returned read-only.
+
+    Args:
+        period: EMA period
+        n: Number of prices in the window
+
+    Returns:
+        Read-only float64 array of length n
+    """
+    multiplier = 2 / (period + 1)
+    weights = (1 - multiplier) ** np.arange(n - 1, -1, -1, dtype=np.float64)
+    weights[1:] *= multiplier
+    weights.flags.writeable = False
+    return weights
+
+
 # =============================================================================
 # MARKET DATA PIPELINE
 # =============================================================================
@@ -310,24 +376,26 @@ class MarketDataPipeline:
             IndicatorSet with all calculated indicators
 
         Raises:
-            InsufficientDataError: Not enough bars for indicator calculation
+            InsufficientDataError: Not enough bars for indicator calculation, or a
+                bar is missing an OHLCV value
         """
         if not bars or len(bars) < 21:  # Need at least 21 bars for slow EMA
             raise InsufficientDataError(f"Need at least 21 bars for indicators, got {len(bars)}")
 
-        closes = np.array([float(b["close"]) for b in bars])
-        highs = np.array([float(b["high"]) for b in bars])
-        lows = np.array([float(b["low"]) for b in bars])
-        volumes = np.array([float(b["volume"]) for b in bars])
+        closes, highs, lows, volumes = _bars_to_columns(bars)
+
+        bollinger_upper, bollinger_lower, bollinger_middle = self._calculate_bollinger(
+            closes, period=20, std=2
+        )
 
         return IndicatorSet(
             ema_fast=self._calculate_ema(closes, period=8),
             ema_slow=self._calculate_ema(closes, period=21),
             rsi=self._calculate_rsi(closes, period=14),
             vwap=self._calculate_vwap(closes, highs, lows, volumes),
-            bollinger_upper=self._calculate_bollinger(closes, period=20, std=2)[0],
-            bollinger_lower=self._calculate_bollinger(closes, period=20, std=2)[1],
-            bollinger_middle=self._calculate_bollinger(closes, period=20, std=2)[2],
+            bollinger_upper=bollinger_upper,
+            bollinger_lower=bollinger_lower,
+            bollinger_middle=bollinger_middle,
         )
 
     def _calculate_ema(self, prices: np.ndarray, period: int) -> float:
@@ -344,11 +412,7 @@ class MarketDataPipeline:
         if len(prices) < period:
             raise InsufficientDataError(f"Need {period} bars for EMA, got {len(prices)}")
 
-        multiplier = 2 / (period + 1)
-        ema = float(prices[0])
-        for price in prices[1:]:
-            ema = (float(price) * multiplier) + (ema * (1 - multiplier))
-        return float(ema)
+        return float(_ema_weights(period, len(prices)) @ prices)
 
     def _calculate_rsi(self, prices: np.ndarray, period: int = 14) -> float:
         """
@@ -364,12 +428,10 @@ class MarketDataPipeline:
         if len(prices) < period + 1:
             raise InsufficientDataError(f"Need {period + 1} bars for RSI, got {len(prices)}")
 
-        deltas = np.diff(prices)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-
-        avg_gain = np.mean(gains[-period:])
-        avg_loss = np.mean(losses[-period:])
+        # Only the last `period` deltas feed the averages — diff just that tail
+        deltas = np.diff(prices[-(period + 1) :])
+        avg_gain = deltas.clip(min=0).sum() / period
+        avg_loss = -deltas.clip(max=0).sum() / period
 
         if avg_loss == 0:
             return 100.0
@@ -397,8 +459,8 @@ class MarketDataPipeline:
         Returns:
             Session VWAP value
         """
-        typical_prices = (highs + lows + closes) / 3
-        cumulative_tpv = np.sum(typical_prices * volumes)
+        # sum(tp * v) as dot products — no typical-price or product temporaries
+        cumulative_tpv = (highs @ volumes + lows @ volumes + closes @ volumes) / 3
         cumulative_volume = np.sum(volumes)
 
         if cumulative_volume == 0:
@@ -423,9 +485,11 @@ class MarketDataPipeline:
         if len(prices) < period:
             raise InsufficientDataError(f"Need {period} bars for Bollinger, got {len(prices)}")
 
+        # Population std of the last window only; reuse the mean instead of np.std
         recent = prices[-period:]
-        middle = float(np.mean(recent))
-        std_dev = float(np.std(recent))
+        middle = float(recent.sum() / period)
+        deviations = recent - middle
+        std_dev = math.sqrt(float(deviations @ deviations) / period)
 
         upper = middle + (std * std_dev)
         lower = middle - (std * std_dev)
@@ -288,6 +288,8 @@ def main() -> None:
         if gateway_config.discord_webhook_url:
             health_checker._send_alert("CRITICAL", f"Bot crashed with error: {e}")
         sys.exit(1)
+    finally:
+        discord_notifier.close()
 
 
 if __name__ == "__main__":
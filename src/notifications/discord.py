@@ -30,18 +30,45 @@ class DiscordNotifier:
         "critical": 10038562,  # Dark red
     }
 
-    def __init__(self, webhook_url: Optional[str], timeout: float = 10.0):
+    def __init__(
+        self,
+        webhook_url: Optional[str],
+        timeout: float = 10.0,
+        client: Optional[httpx.Client] = None,
+    ):
         """
         Initialize Discord notifier.
 
         Args:
             webhook_url: Discord webhook URL. If None, alerts are logged only.
             timeout: HTTP request timeout in seconds.
+            client: Pre-built HTTP client to send through. The caller owns it and
+                is responsible for closing it; close() leaves it open. If None,
+                the notifier creates its own client and keeps it open so bursts
+                of alerts reuse the connection to Discord instead of
+                re-handshaking per message. No client is created in log-only mode.
         """
         self.webhook_url = webhook_url
         self.timeout = timeout
+        self._owns_client = client is None
+        if client is None and webhook_url:
+            client = httpx.Client(timeout=timeout)
+        self._client: Optional[httpx.Client] = client
         self.logger = logging.getLogger(__name__)
 
+    def close(self) -> None:
+        """Close the HTTP client this notifier created, releasing pooled connections."""
+        if self._owns_client and self._client is not None:
+            self._client.close()
+
+    def __enter__(self) -> "DiscordNotifier":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        """Context manager exit."""
+        self.close()
+
     def send_info(self, message: str) -> bool:
         """
         Send info-level notification.
@@ -102,7 +129,7 @@ class DiscordNotifier:
         Returns:
             True if sent successfully, False otherwise.
         """
-        if not self.webhook_url:
+        if not self.webhook_url or self._client is None:
             self.logger.warning(f"Discord webhook not configured — alert not sent: {message}")
             return False
 
@@ -119,11 +146,10 @@ class DiscordNotifier:
         }
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(self.webhook_url, json=payload)
-                response.raise_for_status()
-                self.logger.debug(f"Discord alert sent: {message}")
-                return True
+            response = self._client.post(self.webhook_url, json=payload, timeout=self.timeout)
+            response.raise_for_status()
+            self.logger.debug(f"Discord alert sent: {message}")
+            return True
         except httpx.HTTPStatusError as e:
             self.logger.error(f"Discord webhook returned error: {e.response.status_code}")
             return False
@@ -38,6 +38,9 @@ from src.orchestration.health import GatewayHealthChecker
 
 logger = logging.getLogger(__name__)
 
+# First Gateway poll delay (seconds); doubles up to gateway_health_retry_interval
+GATEWAY_POLL_INITIAL_DELAY = 0.05
+
 
 class StartupState(Enum):
     """Startup orchestration state machine states."""
@@ -134,6 +137,8 @@ class StartupOrchestrator:
             self.logger.exception("Unexpected orchestration failure")
             self.notifier.send_critical(f"💥 Orchestrator crashed: {str(e)}")
             return 1
+        finally:
+            self.notifier.close()
 
     def _transition(self) -> None:
         """Execute next state transition."""
@@ -279,30 +284,51 @@ class StartupOrchestrator:
             self.context.error_message = "Gateway container start timed out (>60s)"
 
     def _wait_for_gateway(self) -> None:
-        """Poll Gateway until healthy or timeout."""
+        """
+        Poll Gateway until healthy or timeout.
+
+        Polls with exponential backoff: the first retry comes after
+        GATEWAY_POLL_INITIAL_DELAY seconds and the delay doubles up to
+        gateway_health_retry_interval. A Gateway that is already up (or
+        comes up quickly) is detected without waiting a full interval.
+        The timeout budget counts time spent sleeping between checks.
+        """
         self.logger.info("Waiting for Gateway to become healthy")
 
         timeout = self.config.gateway_health_timeout
-        retry_interval = self.config.gateway_health_retry_interval
-        max_attempts = timeout // retry_interval
-
-        for attempt in range(1, max_attempts + 1):
-            self.logger.debug(f"Gateway health check attempt {attempt}/{max_attempts}")
-
-            # Check 1: Docker health status
-            docker_healthy = self._check_docker_health()
+        # A non-positive interval would leave the delay at 0 and never exhaust
+        # the timeout budget, so never poll faster than the initial delay
+        retry_interval = max(self.config.gateway_health_retry_interval, GATEWAY_POLL_INITIAL_DELAY)
+        delay = GATEWAY_POLL_INITIAL_DELAY
+        waited = 0.0
+        attempt = 0
+        docker_healthy = False
+
+        while True:
+            attempt += 1
+            self.logger.debug(f"Gateway health check attempt {attempt} ({waited:.2f}s/{timeout}s)")
+
+            # Check 1: Docker health status. Each check spawns a `docker inspect`
+            # process, so stop re-running it once the container reports healthy;
+            # _validate_gateway re-checks it before the bot starts.
+            if not docker_healthy:
+                docker_healthy = self._check_docker_health()
 
             # Check 2: API port responding
             api_responsive = self.health_checker.check_api_port()
 
             if docker_healthy and api_responsive:
-                self.logger.info(f"Gateway healthy after {attempt * retry_interval}s")
+                self.logger.info(f"Gateway healthy after {waited:.2f}s")
                 self.context.gateway_healthy = True
                 self.context.state = StartupState.GATEWAY_VALIDATED
                 return
 
-            if attempt < max_attempts:
-                time.sleep(retry_interval)
+            if waited + delay > timeout:
+                break
+
+            time.sleep(delay)
+            waited += delay
+            delay = min(delay * 2, retry_interval)
 
         # Timeout reached — attempt recovery
         self.logger.warning("Gateway health timeout — attempting recovery")
@@ -328,12 +354,12 @@ class StartupOrchestrator:
                     "{{.State.Health.Status}}",
                     self.config.gateway_container_name,
                 ],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 timeout=5,
             )
-            health = result.stdout.strip()
-            return health == "healthy"
+            # Compare raw bytes — polled repeatedly, no need to decode
+            return bool(result.stdout.strip() == b"healthy")
         except (subprocess.TimeoutExpired, subprocess.CalledProcessError):
             return False
 
@@ -32,6 +32,9 @@ REQUIRED_GAMEPLAN_FIELDS = [
     "data_quality",
 ]
 
+# Frozen once for the all-present fast path; the list above keeps error order
+_REQUIRED_GAMEPLAN_FIELD_SET = frozenset(REQUIRED_GAMEPLAN_FIELDS)
+
 
 # =============================================================================
 # GAMEPLAN VALIDATION
@@ -75,10 +78,13 @@ def load_gameplan(gameplan: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         }
 
     # Check required fields
-    errors = []
-    for field in REQUIRED_GAMEPLAN_FIELDS:
-        if field not in gameplan:
-            errors.append(f"Missing required field: {field}")
+    errors: List[str] = []
+    if not gameplan.keys() >= _REQUIRED_GAMEPLAN_FIELD_SET:
+        errors = [
+            f"Missing required field: {field}"
+            for field in REQUIRED_GAMEPLAN_FIELDS
+            if field not in gameplan
+        ]
 
     if errors:
         return {
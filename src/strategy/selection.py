@@ -18,6 +18,7 @@ Regime Boundaries (from Crucible v4.0 doctrine):
 Safety Principle: When in doubt, deploy Strategy C. Fail safe, not fail open.
 """
 
+import bisect
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -63,6 +64,11 @@ VIX_COMPLACENCY_UPPER = 15.0
 VIX_NORMAL_UPPER = 18.0
 VIX_ELEVATED_UPPER = 25.0
 
+# Sorted upper bounds and the regime for each bucket they delimit
+# (bisect_right: a VIX exactly on a boundary falls into the higher regime)
+_VIX_REGIME_THRESHOLDS = (VIX_COMPLACENCY_UPPER, VIX_NORMAL_UPPER, VIX_ELEVATED_UPPER)
+_VIX_REGIMES = ("complacency", "normal", "elevated", "crisis")
+
 
 # =============================================================================
 # REGIME DETECTION
@@ -106,15 +112,8 @@ def detect_regime(vix: Optional[float]) -> str:
     if vix_val == 0:
         return "complacency"
 
-    # Regime classification
-    if vix_val < VIX_COMPLACENCY_UPPER:
-        return "complacency"
-    elif vix_val < VIX_NORMAL_UPPER:
-        return "normal"
-    elif vix_val < VIX_ELEVATED_UPPER:
-        return "elevated"
-    else:
-        return "crisis"
+    # Regime classification (NaN compares false everywhere → "crisis")
+    return _VIX_REGIMES[bisect.bisect_right(_VIX_REGIME_THRESHOLDS, vix_val)]
 
 
 # =============================================================================
@@ -131,8 +131,15 @@ def calculate_ema_crossover(
             ema_slow: float — current slow EMA value
             insufficient_data: bool — True if not enough bars
     """
-    closes = _extract_close_prices(bars)
+    return _ema_crossover_from_closes(_extract_close_prices(bars), fast_period, slow_period)
+
 
+def _ema_crossover_from_closes(
+    closes: List[float],
+    fast_period: int = STRATEGY_A_EMA_FAST,
+    slow_period: int = STRATEGY_A_EMA_SLOW,
+) -> Dict[str, Any]:
+    """EMA crossover on pre-extracted close prices (see calculate_ema_crossover)."""
     if len(closes) < slow_period:
         return {
             "crossover": "NEUTRAL",
@@ -192,8 +199,11 @@ def calculate_rsi(bars: Optional[List[Dict[str, Any]]], period: int = 14) -> Opt
     Returns:
         RSI value (0.0 to 100.0), or None if insufficient data
     """
-    closes = _extract_close_prices(bars)
+    return _rsi_from_closes(_extract_close_prices(bars), period)
 
+
+def _rsi_from_closes(closes: List[float], period: int = 14) -> Optional[float]:
+    """RSI on pre-extracted close prices (see calculate_rsi)."""
     if len(closes) < period + 1:
         return None
 
@@ -281,8 +291,15 @@ def check_bollinger_touch(
     cross-band false positives when the calculation window spans
     both a directional move and its stabilization.
     """
-    closes = _extract_close_prices(bars)
+    return _bollinger_from_closes(_extract_close_prices(bars), period, std_dev)
 
+
+def _bollinger_from_closes(
+    closes: List[float],
+    period: int = STRATEGY_B_BOLLINGER_PERIOD,
+    std_dev: float = STRATEGY_B_BOLLINGER_STD,
+) -> Dict[str, Any]:
+    """Bollinger touch detection on pre-extracted close prices (see check_bollinger_touch)."""
     if len(closes) < period:
         return {
             "touch": "NONE",
@@ -390,9 +407,12 @@ def evaluate_strategy_a_signal(
     # Check staleness
     is_stale = _check_staleness(bars)
 
+    # Extract closes once and share them across indicators
+    closes = _extract_close_prices(bars)
+
     # Calculate individual indicators
-    ema_result = calculate_ema_crossover(bars)
-    rsi = calculate_rsi(bars)
+    ema_result = _ema_crossover_from_closes(closes)
+    rsi = _rsi_from_closes(closes)
     vwap_result = check_vwap_confirmation(bars)
 
     indicators = {
@@ -413,7 +433,6 @@ def evaluate_strategy_a_signal(
         }
 
     # Check all None closes
-    closes = _extract_close_prices(bars)
     if len(closes) < MIN_BARS_FOR_EMA:
         return {
             "signal": "NEUTRAL",
@@ -498,8 +517,9 @@ def evaluate_strategy_b_signal(
             "indicators": {},
         }
 
-    rsi = calculate_rsi(bars)
-    bollinger = check_bollinger_touch(bars)
+    closes = _extract_close_prices(bars)
+    rsi = _rsi_from_closes(closes)
+    bollinger = _bollinger_from_closes(closes)
 
     indicators = {"rsi": rsi, "bollinger": bollinger}
 
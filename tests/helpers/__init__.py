@@ -11,6 +11,7 @@ from tests.helpers.builders import (
     OrderBuilder,
     PositionBuilder,
 )
+from tests.helpers.mocks import async_return
 
 __all__ = [
     # Assertions
@@ -22,4 +23,6 @@ __all__ = [
     "OrderBuilder",
     "PositionBuilder",
     "FillBuilder",
+    # Mocks
+    "async_return",
 ]
@@ -1,14 +1,34 @@
 """
-Mock implementations for external dependencies.
+Lightweight stand-ins for external dependencies.
 
-Provides mock classes for:
-- IBKR Gateway API (MockGateway)
-- IB connection (MockIBConnection)
-- Market data providers
-- Order execution simulation
+Provides:
+- async_return: cheap awaitable replacement for AsyncMock(return_value=...)
 
-These mocks enable fast, deterministic unit and integration testing
+These helpers enable fast, deterministic unit and integration testing
 without requiring live IBKR Gateway connections.
 """
 
-# TODO: Implement mocks in Chunk 5
+from typing import Any, Awaitable, Callable
+from unittest.mock import Mock
+
+
+def async_return(value: Any = None) -> Callable[..., Awaitable[Any]]:
+    """Build a coroutine function that records its calls and returns ``value``.
+
+    A much cheaper stand-in for ``AsyncMock(return_value=value)`` when a test
+    only awaits the call and then asserts on how it was called.
+
+    Args:
+        value: Value every await resolves to
+
+    Returns:
+        Coroutine function; its ``.mock`` attribute is the call recorder,
+        so ``fn.mock.assert_called_once_with(...)`` works as usual
+    """
+    recorder = Mock(return_value=value)
+
+    async def _call(*args: Any, **kwargs: Any) -> Any:
+        return recorder(*args, **kwargs)
+
+    _call.mock = recorder  # type: ignore[attr-defined]
+    return _call
@@ -18,6 +18,10 @@ Coverage Target: Component of ≥85% aggregate for src/strategy/
 import pytest
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, List
+from unittest.mock import patch
+
+from src.strategy.execution import evaluate_signals, load_gameplan
+from src.strategy.selection import select_strategy
 
 # =============================================================================
 # GAMEPLAN FIXTURES
@@ -214,8 +218,6 @@ class TestGameplanValidation:
 
     def test_valid_gameplan_a_loads_correctly(self, strategy_a_gameplan):
         """Valid Strategy A gameplan parses without error."""
-        from src.strategy.execution import load_gameplan
-
         result = load_gameplan(strategy_a_gameplan)
 
         assert result["valid"] is True
@@ -224,8 +226,6 @@ class TestGameplanValidation:
 
     def test_valid_gameplan_b_loads_correctly(self, strategy_b_gameplan):
         """Valid Strategy B gameplan parses without error."""
-        from src.strategy.execution import load_gameplan
-
         result = load_gameplan(strategy_b_gameplan)
 
         assert result["valid"] is True
@@ -233,8 +233,6 @@ class TestGameplanValidation:
 
     def test_valid_gameplan_c_loads_correctly(self, strategy_c_gameplan):
         """Valid Strategy C gameplan parses without error."""
-        from src.strategy.execution import load_gameplan
-
         result = load_gameplan(strategy_c_gameplan)
 
         assert result["valid"] is True
@@ -245,8 +243,6 @@ class TestGameplanValidation:
         CRITICAL SAFETY: Malformed gameplan → Strategy C.
         Never trade with invalid configuration.
         """
-        from src.strategy.execution import load_gameplan
-
         result = load_gameplan(malformed_gameplan)
 
         assert result["strategy"] == "C"
@@ -254,29 +250,48 @@ class TestGameplanValidation:
 
     def test_none_gameplan_defaults_to_strategy_c(self):
         """None gameplan → Strategy C."""
-        from src.strategy.execution import load_gameplan
-
         result = load_gameplan(None)
 
         assert result["strategy"] == "C"
 
     def test_empty_dict_gameplan_defaults_to_strategy_c(self):
         """Empty dict gameplan → Strategy C."""
-        from src.strategy.execution import load_gameplan
-
         result = load_gameplan({})
 
         assert result["strategy"] == "C"
 
+    def test_strategy_c_fallback_returns_independent_copies(self):
+        """Fallback results are fresh dicts; mutating one never leaks into the next."""
+        first = load_gameplan(None)
+        first["validation_errors"].append("caller annotation")
+        first["strategy"] = "A"
+
+        second = load_gameplan(None)
+
+        assert second["strategy"] == "C"
+        assert second["validation_errors"] == ["Gameplan is None or not a dict"]
+
     def test_gameplan_with_quarantine_active_forces_c(self, strategy_a_gameplan):
         """Gameplan where data_quality.quarantine_active=True → Strategy C."""
-        from src.strategy.execution import load_gameplan
-
         strategy_a_gameplan["data_quality"]["quarantine_active"] = True
         result = load_gameplan(strategy_a_gameplan)
 
         assert result["strategy"] == "C"
 
+    def test_reloading_mutated_gameplan_is_revalidated(self, strategy_a_gameplan):
+        """
+        CRITICAL SAFETY: A gameplan mutated after loading must be re-validated.
+        Results are never reused by object identity — a stale Strategy A
+        result after a quarantine flag flips would authorize trading.
+        """
+        first = load_gameplan(strategy_a_gameplan)
+        assert first["strategy"] == "A"
+
+        strategy_a_gameplan["data_quality"]["quarantine_active"] = True
+        second = load_gameplan(strategy_a_gameplan)
+
+        assert second["strategy"] == "C"
+
 
 # =============================================================================
 # STRATEGY EXECUTION PIPELINE TESTS
@@ -294,8 +309,6 @@ class TestStrategyExecutionPipeline:
         WHEN: Full pipeline executes
         THEN: Produces actionable trade decision for SPY and/or QQQ
         """
-        from src.strategy.execution import evaluate_signals
-
         decisions = evaluate_signals(strategy_a_gameplan, trending_market_data)
 
         assert isinstance(decisions, list)
@@ -313,8 +326,6 @@ class TestStrategyExecutionPipeline:
         WHEN: Full pipeline executes
         THEN: Produces mean reversion trade decision for SPY
         """
-        from src.strategy.execution import evaluate_signals
-
         decisions = evaluate_signals(strategy_b_gameplan, mean_reverting_market_data)
 
         assert isinstance(decisions, list)
@@ -329,22 +340,33 @@ class TestStrategyExecutionPipeline:
         WHEN: Pipeline executes
         THEN: No trade decisions produced (alert-only mode)
         """
-        from src.strategy.execution import evaluate_signals
-
         decisions = evaluate_signals(strategy_c_gameplan, trending_market_data)
 
         # Strategy C = no new trades
         for decision in decisions:
             assert decision["action"] in ("HOLD", "CLOSE", "NEUTRAL")
 
+    def test_strategy_c_skips_indicator_math(self, strategy_c_gameplan, trending_market_data):
+        """
+        GIVEN: Strategy C gameplan with market data available
+        WHEN: Pipeline executes
+        THEN: Returns before any signal evaluation runs
+        """
+        with patch("src.strategy.execution.evaluate_strategy_a_signal") as signal_a, patch(
+            "src.strategy.execution.evaluate_strategy_b_signal"
+        ) as signal_b:
+            decisions = evaluate_signals(strategy_c_gameplan, trending_market_data)
+
+        assert [d["action"] for d in decisions] == ["HOLD"]
+        signal_a.assert_not_called()
+        signal_b.assert_not_called()
+
     def test_pipeline_with_no_market_data_defaults_safe(self, strategy_a_gameplan):
         """
         GIVEN: Strategy A gameplan but no market data available
         WHEN: Pipeline executes
         THEN: No trades (can't generate signals without data)
         """
-        from src.strategy.execution import evaluate_signals
-
         decisions = evaluate_signals(strategy_a_gameplan, {})
 
         for decision in decisions:
@@ -356,8 +378,6 @@ class TestStrategyExecutionPipeline:
         WHEN: Pipeline executes
         THEN: No new entry decisions (PDT exhausted)
         """
-        from src.strategy.execution import evaluate_signals
-
         strategy_a_gameplan["hard_limits"]["pdt_trades_remaining"] = 0
         decisions = evaluate_signals(strategy_a_gameplan, trending_market_data)
 
@@ -381,8 +401,6 @@ class TestStrategyTransitions:
         WHEN: VIX spikes above 25 (regime shift to crisis)
         THEN: Strategy transitions to C
         """
-        from src.strategy.selection import select_strategy
-
         # Before spike: Strategy A
         before = select_strategy(16.5, catalysts=[])
         assert before["strategy"] == "A"
@@ -397,8 +415,6 @@ class TestStrategyTransitions:
         WHEN: VIX rises to elevated (22.0)
         THEN: Strategy transitions to B
         """
-        from src.strategy.selection import select_strategy
-
         before = select_strategy(16.5, catalysts=[])
         assert before["strategy"] == "A"
 
@@ -411,8 +427,6 @@ class TestStrategyTransitions:
         WHEN: VIX drops to normal (16.0)
         THEN: Strategy transitions to A
         """
-        from src.strategy.selection import select_strategy
-
         before = select_strategy(22.0, catalysts=[])
         assert before["strategy"] == "B"
 
@@ -428,8 +442,6 @@ class TestStrategyTransitions:
         This test validates the concept — the actual enforcement
         is in the execution engine's session state.
         """
-        from src.strategy.selection import select_strategy
-
         # Strategy C due to governor
         locked = select_strategy(16.5, catalysts=[], weekly_governor_active=True)
         assert locked["strategy"] == "C"
@@ -449,8 +461,6 @@ class TestOutputContracts:
 
     def test_strategy_selection_output_schema(self):
         """Strategy selection output has all required fields."""
-        from src.strategy.selection import select_strategy
-
         result = select_strategy(16.5, catalysts=[])
 
         required_fields = ["strategy", "regime", "symbols", "position_size_multiplier"]
@@ -459,8 +469,6 @@ class TestOutputContracts:
 
     def test_signal_evaluation_output_schema(self, strategy_a_gameplan, trending_market_data):
         """Signal evaluation output has all required fields per decision."""
-        from src.strategy.execution import evaluate_signals
-
         decisions = evaluate_signals(strategy_a_gameplan, trending_market_data)
 
         for decision in decisions:
@@ -9,6 +9,7 @@ Tests cover:
 
 import json
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -21,47 +22,80 @@ from src.orchestration.startup import StartupOrchestrator, StartupState
 # =============================================================================
 
 
-@pytest.fixture
-def valid_gameplan(tmp_path: Path) -> Path:
-    """Create a valid gameplan file."""
-    gameplan_path = tmp_path / "gameplan.json"
-    gameplan = {
-        "date": "2026-02-10",
-        "strategy": "A",
-        "regime": "trending",
-        "symbols": ["SPY"],
-        "hard_limits": {
-            "max_daily_loss_pct": 2.0,
-            "max_single_position": 5,
-        },
-        "data_quality": {
-            "quarantine_active": False,
-            "min_volume": 1000,
-            "max_spread_pct": 0.5,
-        },
-    }
-    gameplan_path.write_text(json.dumps(gameplan))
+VALID_GAMEPLAN: dict[str, Any] = {
+    "date": "2026-02-10",
+    "strategy": "A",
+    "regime": "trending",
+    "symbols": ["SPY"],
+    "hard_limits": {
+        "max_daily_loss_pct": 2.0,
+        "max_single_position": 5,
+    },
+    "data_quality": {
+        "quarantine_active": False,
+        "min_volume": 1000,
+        "max_spread_pct": 0.5,
+    },
+}
+
+
+@pytest.fixture(scope="session")
+def valid_gameplan(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Create a valid gameplan file once per session.
+
+    The orchestrator only reads this file, so every test can share it.
+    Tests that need a different gameplan point the config elsewhere.
+    """
+    gameplan_path = tmp_path_factory.mktemp("gameplan") / "gameplan.json"
+    gameplan_path.write_text(json.dumps(VALID_GAMEPLAN))
     return gameplan_path
 
 
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make every time.sleep in the orchestrator a no-op for this module."""
+    monkeypatch.setattr("time.sleep", lambda *_: None)
+
+
+# Static (path-independent) settings shared by every integration config
+INTEGRATION_CONFIG_DEFAULTS: dict[str, Any] = {
+    "gateway_host": "localhost",
+    "gateway_port": 4002,
+    "gateway_health_timeout": 5,
+    "gateway_health_retry_interval": 1,
+    "health_check_timeout": 1,
+    "discord_webhook_url": None,
+    "bot_log_level": "DEBUG",
+    "gateway_container_name": "test-gateway",
+}
+
+
 @pytest.fixture
 def integration_config(tmp_path: Path, valid_gameplan: Path) -> OrchestrationConfig:
-    """Create configuration for integration tests."""
+    """
+    Create configuration for integration tests.
+
+    Function-scoped because tests mutate the config; only the per-test
+    paths are filled in here.
+    """
     return OrchestrationConfig(
-        gateway_host="localhost",
-        gateway_port=4002,
+        **INTEGRATION_CONFIG_DEFAULTS,
         docker_compose_dir=tmp_path / "docker",
-        gateway_health_timeout=5,
-        gateway_health_retry_interval=1,
-        health_check_timeout=1,
         gameplan_path=valid_gameplan,
         emergency_gameplan_path=tmp_path / "state" / "emergency_gameplan.json",
-        discord_webhook_url=None,
-        bot_log_level="DEBUG",
-        gateway_container_name="test-gateway",
     )
 
 
+@pytest.fixture
+def running_bot_process() -> MagicMock:
+    """Mock bot process that is still running (poll() returns None)."""
+    process = MagicMock()
+    process.poll.return_value = None  # Still running
+    process.pid = 12345
+    return process
+
+
 # =============================================================================
 # FULL STARTUP SEQUENCE
 # =============================================================================
@@ -74,14 +108,13 @@ class TestFullStartupSequence:
     @patch("src.orchestration.startup.GatewayHealthChecker.check_api_port", return_value=True)
     @patch("subprocess.Popen")
     @patch("subprocess.run")
-    @patch("time.sleep")
     def test_successful_startup_with_valid_gameplan(
         self,
-        mock_sleep: MagicMock,
         mock_run: MagicMock,
         mock_popen: MagicMock,
         mock_health: MagicMock,
         integration_config: OrchestrationConfig,
+        running_bot_process: MagicMock,
     ) -> None:
         """Complete startup succeeds with valid gameplan."""
         # Mock Docker responses
@@ -91,16 +124,12 @@ class TestFullStartupSequence:
             # _start_gateway (check if running)
             MagicMock(returncode=0, stdout="Up 5 minutes"),
             # _check_docker_health (first call)
-            MagicMock(returncode=0, stdout="healthy"),
+            MagicMock(returncode=0, stdout=b"healthy"),
             # _check_docker_health (validation)
-            MagicMock(returncode=0, stdout="healthy"),
+            MagicMock(returncode=0, stdout=b"healthy"),
         ]
 
-        # Mock bot process
-        mock_process = MagicMock()
-        mock_process.poll.return_value = None  # Still running
-        mock_process.pid = 12345
-        mock_popen.return_value = mock_process
+        mock_popen.return_value = running_bot_process
 
         orchestrator = StartupOrchestrator(integration_config)
         exit_code = orchestrator.run()
@@ -112,14 +141,13 @@ class TestFullStartupSequence:
     @patch("src.orchestration.startup.GatewayHealthChecker.check_api_port", return_value=True)
     @patch("subprocess.Popen")
     @patch("subprocess.run")
-    @patch("time.sleep")
     def test_startup_with_missing_gameplan_deploys_strategy_c(
         self,
-        mock_sleep: MagicMock,
         mock_run: MagicMock,
         mock_popen: MagicMock,
         mock_health: MagicMock,
         integration_config: OrchestrationConfig,
+        running_bot_process: MagicMock,
         tmp_path: Path,
     ) -> None:
         """Startup with missing gameplan deploys Strategy C."""
@@ -129,15 +157,11 @@ class TestFullStartupSequence:
         mock_run.side_effect = [
             MagicMock(returncode=0),  # _docker_available
             MagicMock(returncode=0, stdout="Up 5 minutes"),  # _start_gateway
-            MagicMock(returncode=0, stdout="healthy"),  # _check_docker_health
-            MagicMock(returncode=0, stdout="healthy"),  # _check_docker_health
+            MagicMock(returncode=0, stdout=b"healthy"),  # _check_docker_health
+            MagicMock(returncode=0, stdout=b"healthy"),  # _check_docker_health
         ]
 
-        # Mock bot process
-        mock_process = MagicMock()
-        mock_process.poll.return_value = None
-        mock_process.pid = 12345
-        mock_popen.return_value = mock_process
+        mock_popen.return_value = running_bot_process
 
         orchestrator = StartupOrchestrator(integration_config)
         exit_code = orchestrator.run()
@@ -172,17 +196,21 @@ class TestGatewayHealthValidation:
 
     @patch("src.orchestration.startup.GatewayHealthChecker.check_api_port")
     @patch("subprocess.run")
-    @patch("time.sleep")
     def test_gateway_startup_and_health_check(
         self,
-        mock_sleep: MagicMock,
         mock_run: MagicMock,
         mock_health: MagicMock,
         integration_config: OrchestrationConfig,
     ) -> None:
         """Gateway startup includes health validation."""
-        # Mock Docker responses - need enough for loop iterations
-        mock_run.return_value = MagicMock(returncode=0, stdout="healthy")
+
+        # Mock Docker responses - `docker inspect` health output is raw bytes
+        def docker(cmd: list[str], **_: Any) -> MagicMock:
+            if cmd[1] == "inspect":
+                return MagicMock(returncode=0, stdout=b"healthy")
+            return MagicMock(returncode=0, stdout="")
+
+        mock_run.side_effect = docker
 
         # Mock health checker to fail initially, then succeed
         mock_health.side_effect = [False, False, True]
@@ -197,10 +225,8 @@ class TestGatewayHealthValidation:
 
     @patch("src.orchestration.startup.GatewayHealthChecker.check_api_port", return_value=False)
     @patch("subprocess.run")
-    @patch("time.sleep")
     def test_gateway_restart_on_timeout(
         self,
-        mock_sleep: MagicMock,
         mock_run: MagicMock,
         mock_health: MagicMock,
         integration_config: OrchestrationConfig,
@@ -226,18 +252,14 @@ class TestBotLaunchIntegration:
     """Test bot launch integration."""
 
     @patch("subprocess.Popen")
-    @patch("time.sleep")
     def test_bot_launched_with_correct_environment(
         self,
-        mock_sleep: MagicMock,
         mock_popen: MagicMock,
         integration_config: OrchestrationConfig,
+        running_bot_process: MagicMock,
     ) -> None:
         """Bot is launched with correct environment variables."""
-        mock_process = MagicMock()
-        mock_process.poll.return_value = None
-        mock_process.pid = 12345
-        mock_popen.return_value = mock_process
+        mock_popen.return_value = running_bot_process
 
         orchestrator = StartupOrchestrator(integration_config)
         orchestrator.context.gameplan_path = integration_config.gameplan_path
@@ -254,10 +276,8 @@ class TestBotLaunchIntegration:
         assert env.get("LOG_LEVEL") == "DEBUG"
 
     @patch("subprocess.Popen")
-    @patch("time.sleep")
     def test_bot_crash_detection(
         self,
-        mock_sleep: MagicMock,
         mock_popen: MagicMock,
         integration_config: OrchestrationConfig,
     ) -> None:
@@ -288,14 +308,13 @@ class TestStrategyCGeneration:
     @patch("src.orchestration.startup.GatewayHealthChecker.check_api_port", return_value=True)
     @patch("subprocess.Popen")
     @patch("subprocess.run")
-    @patch("time.sleep")
     def test_strategy_c_gameplan_created_and_used(
         self,
-        mock_sleep: MagicMock,
         mock_run: MagicMock,
         mock_popen: MagicMock,
         mock_health: MagicMock,
         integration_config: OrchestrationConfig,
+        running_bot_process: MagicMock,
         tmp_path: Path,
     ) -> None:
         """Strategy C gameplan is created and passed to bot."""
@@ -308,14 +327,11 @@ class TestStrategyCGeneration:
         mock_run.side_effect = [
             MagicMock(returncode=0),  # _docker_available
             MagicMock(returncode=0, stdout="Up 5 minutes"),  # _start_gateway
-            MagicMock(returncode=0, stdout="healthy"),  # _check_docker_health
-            MagicMock(returncode=0, stdout="healthy"),  # _check_docker_health
+            MagicMock(returncode=0, stdout=b"healthy"),  # _check_docker_health
+            MagicMock(returncode=0, stdout=b"healthy"),  # _check_docker_health
         ]
 
-        mock_process = MagicMock()
-        mock_process.poll.return_value = None
-        mock_process.pid = 12345
-        mock_popen.return_value = mock_process
+        mock_popen.return_value = running_bot_process
 
         orchestrator = StartupOrchestrator(integration_config)
         exit_code = orchestrator.run()
@@ -26,6 +26,53 @@ from src.integrations.market_data_pipeline import AlphaLearningViolationError
 from src.integrations.ibkr_gateway import IBKRGateway, GatewayConfig, ExecutionMode
 from src.integrations.order_executor import OrderExecutor
 from src.strategies.base import Signal, Direction, StrategyType
+from tests.helpers import async_return
+
+# Fixed signal time; none of these tests check signal age
+_NOW = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def paper_gateway_config():
+    """Paper trading gateway config, shared read-only across the module."""
+    return GatewayConfig.paper_trading()
+
+
+@pytest.fixture(scope="module")
+def buy_signal_spy():
+    """Plain SPY BUY signal, shared read-only across the module."""
+    return Signal(
+        direction=Direction.BUY,
+        symbol="SPY",
+        confidence=0.8,
+        rationale="Test",
+        timestamp=_NOW,
+        strategy_type=StrategyType.A,
+    )
+
+
+@pytest.fixture(autouse=True, scope="class")
+def _patched_gateway_deps():
+    """
+    Replace IBKRGateway's connection, contract and market data classes per test class.
+
+    Only names in the ibkr_gateway namespace are patched, so tests that build
+    providers or executors directly are unaffected. Tests that assert on one
+    of these classes patch it again locally to get a fresh mock.
+    """
+    with patch("src.integrations.ibkr_gateway.IBKRConnection"), patch(
+        "src.integrations.ibkr_gateway.ContractManager"
+    ), patch("src.integrations.ibkr_gateway.MarketDataProvider"):
+        yield
+
+
+class _StubConnection:
+    """Bare stand-in for IBKRConnection where no attribute is ever touched."""
+
+
+class _StubContracts:
+    """Bare stand-in for ContractManager where no attribute is ever touched."""
+
 
 # =============================================================================
 # ALPHA LEARNING 1: snapshot=True MANDATORY
@@ -46,34 +93,31 @@ class TestAlphaLearning1_SnapshotMode:
     def test_market_data_provider_rejects_snapshot_false(self):
         """Test that MarketDataProvider blocks snapshot=False initialization."""
         from src.broker.market_data import MarketDataProvider
-        from src.broker.connection import IBKRConnection
-        from src.broker.contracts import ContractManager
-
-        conn = MagicMock(spec=IBKRConnection)
-        contracts = MagicMock(spec=ContractManager)
 
+        # The snapshot guard fires before either dependency is used,
+        # so plain stubs suffice (no spec introspection needed).
         with pytest.raises(SnapshotModeViolationError) as exc_info:
-            MarketDataProvider(conn, contracts, snapshot_mode=False)
+            MarketDataProvider(
+                _StubConnection(),  # type: ignore[arg-type]
+                _StubContracts(),  # type: ignore[arg-type]
+                snapshot_mode=False,
+            )
 
         assert "snapshot=True is MANDATORY" in str(exc_info.value)
         assert "buffer overflow" in str(exc_info.value).lower()
 
     @patch("src.integrations.ibkr_gateway.MarketDataProvider")
-    def test_gateway_enforces_snapshot_true(self, mock_provider_class):
+    def test_gateway_enforces_snapshot_true(self, mock_provider_class, paper_gateway_config):
         """Test that IBKRGateway initializes MarketDataProvider with snapshot=True."""
 
         mock_risk_manager = MagicMock()
-        config = GatewayConfig.paper_trading()
 
         # Mock the MarketDataProvider to have snapshot_mode attribute
         mock_provider_instance = MagicMock()
         mock_provider_instance.snapshot_mode = True
         mock_provider_class.return_value = mock_provider_instance
 
-        with patch("src.integrations.ibkr_gateway.IBKRConnection"), patch(
-            "src.integrations.ibkr_gateway.ContractManager"
-        ):
-            _gateway = IBKRGateway(config, mock_risk_manager, mode=ExecutionMode.DRY_RUN)
+        _gateway = IBKRGateway(paper_gateway_config, mock_risk_manager, mode=ExecutionMode.DRY_RUN)
 
         # Verify MarketDataProvider was called with snapshot_mode=True
         mock_provider_class.assert_called_once()
@@ -97,39 +141,38 @@ class TestAlphaLearning2_HistoricalDataLimit:
     Pipeline.fetch_historical_data() also validates before provider call.
     """
 
-    @pytest.mark.asyncio
-    async def test_gateway_rejects_over_60_minutes(self):
-        """Test that Gateway rejects >60 minute historical data requests."""
-        mock_risk_manager = MagicMock()
-        config = GatewayConfig.paper_trading()
+    def test_gateway_rejects_over_60_minutes(self, paper_gateway_config):
+        """
+        Test that Gateway rejects >60 minute historical data requests.
 
-        with patch("src.integrations.ibkr_gateway.IBKRConnection"), patch(
-            "src.integrations.ibkr_gateway.ContractManager"
-        ), patch("src.integrations.ibkr_gateway.MarketDataProvider"):
+        The check runs before the first await, so a single send() drives the
+        coroutine to the rejection without an event loop.
+        """
+        mock_risk_manager = MagicMock()
 
-            gateway = IBKRGateway(config, mock_risk_manager, mode=ExecutionMode.DRY_RUN)
-            gateway._connected = True  # Simulate connected state
+        gateway = IBKRGateway(paper_gateway_config, mock_risk_manager, mode=ExecutionMode.DRY_RUN)
+        gateway._connected = True  # Simulate connected state
 
-            with pytest.raises(AlphaLearningViolationError) as exc_info:
-                await gateway.get_historical_data("SPY", duration_minutes=120)
+        coro = gateway.get_historical_data("SPY", duration_minutes=120)
+        with pytest.raises(AlphaLearningViolationError) as exc_info:
+            coro.send(None)
 
-            assert "1-hour limit" in str(exc_info.value) or "60 minutes" in str(exc_info.value)
-            assert "120" in str(exc_info.value)
+        assert "1-hour limit" in str(exc_info.value) or "60 minutes" in str(exc_info.value)
+        assert "120" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_pipeline_rejects_over_60_minutes(self):
-        """Test that MarketDataPipeline rejects >60 minute requests."""
+    def test_pipeline_rejects_over_60_minutes(self):
+        """Test that MarketDataPipeline rejects >60 minute requests (pre-await, no loop)."""
         from src.integrations.market_data_pipeline import MarketDataPipeline
 
         mock_provider = MagicMock()
         pipeline = MarketDataPipeline(mock_provider)
 
+        coro = pipeline.fetch_historical_data("SPY", duration_minutes=121)
         with pytest.raises(AlphaLearningViolationError) as exc_info:
-            await pipeline.fetch_historical_data("SPY", duration_minutes=121)
+            coro.send(None)
 
         assert "1-hour limit" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_60_minutes_exactly_allowed(self):
         """Test that exactly 60 minutes is allowed."""
         from src.integrations.market_data_pipeline import MarketDataPipeline
@@ -162,76 +205,34 @@ class TestAlphaLearning3_TimeoutPropagation:
     Enforcement: Every public method accepts timeout parameter.
     """
 
-    @pytest.mark.asyncio
-    async def test_gateway_market_data_accepts_timeout(self):
-        """Test that get_market_data accepts timeout parameter."""
-        mock_risk_manager = MagicMock()
-        config = GatewayConfig.paper_trading()
-
-        with patch("src.integrations.ibkr_gateway.IBKRConnection"), patch(
-            "src.integrations.ibkr_gateway.ContractManager"
-        ), patch("src.integrations.ibkr_gateway.MarketDataProvider"):
-
-            gateway = IBKRGateway(config, mock_risk_manager, mode=ExecutionMode.DRY_RUN)
-            gateway._connected = True
-            gateway._pipeline.fetch_market_data = AsyncMock(return_value=MagicMock(symbol="SPY"))
-
-            # Should accept timeout parameter without error
-            await gateway.get_market_data("SPY", timeout=15.0)
-
-            # Verify timeout was passed through
-            gateway._pipeline.fetch_market_data.assert_called_once_with("SPY", timeout=15.0)
-
-    @pytest.mark.asyncio
-    async def test_gateway_submit_order_accepts_timeout(self):
-        """Test that submit_order accepts timeout parameter."""
+    @pytest.mark.parametrize(
+        ("method", "collaborator", "build_args", "timeout"),
+        [
+            ("get_market_data", "_pipeline.fetch_market_data", lambda signal: ("SPY",), 15.0),
+            ("submit_order", "_executor.execute", lambda signal: (signal, {}), 45.0),
+            ("get_positions", "_positions.get_all", lambda signal: (), 20.0),
+        ],
+        ids=["get_market_data", "submit_order", "get_positions"],
+    )
+    async def test_gateway_method_propagates_timeout(
+        self, method, collaborator, build_args, timeout, paper_gateway_config, buy_signal_spy
+    ):
+        """Test that each public gateway call passes its timeout to the collaborator."""
         mock_risk_manager = MagicMock()
-        config = GatewayConfig.paper_trading()
-
-        with patch("src.integrations.ibkr_gateway.IBKRConnection"), patch(
-            "src.integrations.ibkr_gateway.ContractManager"
-        ), patch("src.integrations.ibkr_gateway.MarketDataProvider"):
-
-            gateway = IBKRGateway(config, mock_risk_manager, mode=ExecutionMode.DRY_RUN)
-            gateway._connected = True
-            gateway._executor.execute = AsyncMock(return_value=MagicMock(order_id="ORD_001"))
-
-            signal = Signal(
-                direction=Direction.BUY,
-                symbol="SPY",
-                confidence=0.8,
-                rationale="Test",
-                timestamp=datetime.now(timezone.utc),
-                strategy_type=StrategyType.A,
-            )
 
-            # Should accept timeout parameter
-            await gateway.submit_order(signal, {}, timeout=45.0)
-
-            # Verify timeout was passed through
-            gateway._executor.execute.assert_called_once()
-            call_kwargs = gateway._executor.execute.call_args[1]
-            assert call_kwargs.get("timeout") == 45.0
-
-    @pytest.mark.asyncio
-    async def test_gateway_get_positions_accepts_timeout(self):
-        """Test that get_positions accepts timeout parameter."""
-        mock_risk_manager = MagicMock()
-        config = GatewayConfig.paper_trading()
+        gateway = IBKRGateway(paper_gateway_config, mock_risk_manager, mode=ExecutionMode.DRY_RUN)
+        gateway._connected = True
+        owner_name, method_name = collaborator.split(".")
+        delegate = async_return(MagicMock())
+        setattr(getattr(gateway, owner_name), method_name, delegate)
 
-        with patch("src.integrations.ibkr_gateway.IBKRConnection"), patch(
-            "src.integrations.ibkr_gateway.ContractManager"
-        ), patch("src.integrations.ibkr_gateway.MarketDataProvider"):
+        args = build_args(buy_signal_spy)
 
-            gateway = IBKRGateway(config, mock_risk_manager, mode=ExecutionMode.DRY_RUN)
-            gateway._connected = True
-            gateway._positions.get_all = AsyncMock(return_value=[])
+        # Should accept timeout parameter without error
+        await getattr(gateway, method)(*args, timeout=timeout)
 
-            # Should accept timeout parameter
-            await gateway.get_positions(timeout=20.0)
-
-            # Verify timeout was passed through
-            gateway._positions.get_all.assert_called_once_with(timeout=20.0)
+        # Verify timeout was passed through
+        delegate.mock.assert_called_once_with(*args, timeout=timeout)
 
 
 # =============================================================================
@@ -261,8 +262,7 @@ class TestAlphaLearning4_ContractQualification:
         # Verify pipeline has access to contract manager
         assert hasattr(pipeline._provider, "contract_manager")
 
-    @pytest.mark.asyncio
-    async def test_order_executor_qualifies_contracts(self):
+    async def test_order_executor_qualifies_contracts(self, buy_signal_spy):
         """Test that OrderExecutor qualifies contracts before orders."""
         from src.integrations.order_executor import ExecutionMode
 
@@ -281,16 +281,7 @@ class TestAlphaLearning4_ContractQualification:
             mode=ExecutionMode.DRY_RUN,
         )
 
-        signal = Signal(
-            direction=Direction.BUY,
-            symbol="SPY",
-            confidence=0.8,
-            rationale="Test",
-            timestamp=datetime.now(timezone.utc),
-            strategy_type=StrategyType.A,
-        )
-
-        await executor.execute(signal, {"strategy_id": "test"})
+        await executor.execute(buy_signal_spy, {"strategy_id": "test"})
 
         # In dry-run mode, contracts aren't qualified, but the executor HAS the contract manager
         assert executor._contracts is not None
@@ -312,47 +303,33 @@ class TestAlphaLearning5_OperatorID:
     _build_ibkr_order() sets order.account = operator_id.
     """
 
-    def test_gateway_default_operator_id(self):
+    def test_gateway_default_operator_id(self, paper_gateway_config):
         """Test that Gateway uses default operator ID CSATSPRIM."""
         mock_risk_manager = MagicMock()
-        config = GatewayConfig.paper_trading()
-
-        with patch("src.integrations.ibkr_gateway.IBKRConnection"), patch(
-            "src.integrations.ibkr_gateway.ContractManager"
-        ), patch("src.integrations.ibkr_gateway.MarketDataProvider"):
 
-            gateway = IBKRGateway(config, mock_risk_manager, mode=ExecutionMode.DRY_RUN)
+        gateway = IBKRGateway(paper_gateway_config, mock_risk_manager, mode=ExecutionMode.DRY_RUN)
 
         assert gateway.operator_id == "CSATSPRIM"
 
-    def test_gateway_custom_operator_id(self):
+    def test_gateway_custom_operator_id(self, paper_gateway_config):
         """Test that Gateway accepts custom operator ID."""
         mock_risk_manager = MagicMock()
-        config = GatewayConfig.paper_trading()
-
-        with patch("src.integrations.ibkr_gateway.IBKRConnection"), patch(
-            "src.integrations.ibkr_gateway.ContractManager"
-        ), patch("src.integrations.ibkr_gateway.MarketDataProvider"):
 
-            gateway = IBKRGateway(
-                config,
-                mock_risk_manager,
-                mode=ExecutionMode.DRY_RUN,
-                operator_id="CUSTOM_ID",
-            )
+        gateway = IBKRGateway(
+            paper_gateway_config,
+            mock_risk_manager,
+            mode=ExecutionMode.DRY_RUN,
+            operator_id="CUSTOM_ID",
+        )
 
         assert gateway.operator_id == "CUSTOM_ID"
 
-    @pytest.mark.asyncio
-    async def test_order_executor_attaches_operator_id(self):
+    def test_order_executor_attaches_operator_id(self, buy_signal_spy):
         """Test that OrderExecutor attaches operator ID to all orders."""
-
+        # _build_trade_request is pure: no risk evaluation or event loop involved
         mock_connection = MagicMock()
         mock_contracts = MagicMock()
         mock_risk_manager = MagicMock()
-        mock_risk_manager.evaluate = MagicMock(
-            return_value=MagicMock(approved=True, rejections=[], approved_contracts=Decimal("1"))
-        )
 
         executor = OrderExecutor(
             mock_connection,
@@ -362,16 +339,7 @@ class TestAlphaLearning5_OperatorID:
             operator_id="TEST_OPERATOR",
         )
 
-        signal = Signal(
-            direction=Direction.BUY,
-            symbol="SPY",
-            confidence=0.8,
-            rationale="Test",
-            timestamp=datetime.now(timezone.utc),
-            strategy_type=StrategyType.A,
-        )
-
-        trade_request = executor._build_trade_request(signal, {"strategy_id": "test"})
+        trade_request = executor._build_trade_request(buy_signal_spy, {"strategy_id": "test"})
 
         assert trade_request.operator_id == "TEST_OPERATOR"
 
@@ -432,15 +400,11 @@ class TestAllAlphaLearningsEnforced:
             "operator_id_compliance",
         ]
 
-        # Count test classes in this module
-        import sys
-        import inspect
-
-        current_module = sys.modules[__name__]
+        # Count test classes in this module (direct namespace scan, no getmembers sort)
         test_class_names = [
             name
-            for name, obj in inspect.getmembers(current_module)
-            if inspect.isclass(obj) and name.startswith("TestAlphaLearning")
+            for name, obj in globals().items()
+            if name.startswith("TestAlphaLearning") and isinstance(obj, type)
         ]
 
         # We should have one test class per alpha learning
@@ -5,7 +5,7 @@ Tests gateway initialization, connection management, and orchestration.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 from src.integrations.ibkr_gateway import (
     IBKRGateway,
@@ -14,6 +14,7 @@ from src.integrations.ibkr_gateway import (
     GatewayError,
     GatewayNotConnectedError,
 )
+from tests.helpers import async_return
 
 
 @pytest.fixture
@@ -88,14 +89,12 @@ class TestGatewayInitialization:
 class TestGatewayConnection:
     """Test gateway connection management."""
 
-    @pytest.mark.asyncio
     @patch("src.integrations.ibkr_gateway.IBKRConnection")
     async def test_connect_success(self, mock_connection_class, gateway_config, mock_risk_manager):
         """Test successful connection."""
         # Mock connection
         mock_conn_instance = MagicMock()
-        mock_conn_instance.connect = AsyncMock(return_value=True)
-        mock_conn_instance.health_check = AsyncMock(return_value={"market_data_available": True})
+        mock_conn_instance.connect = MagicMock(return_value=True)
         mock_connection_class.return_value = mock_conn_instance
 
         gateway = IBKRGateway(gateway_config, mock_risk_manager, mode=ExecutionMode.DRY_RUN)
@@ -107,15 +106,13 @@ class TestGatewayConnection:
         assert gateway.is_connected
         mock_conn_instance.connect.assert_called_once()
 
-    @pytest.mark.asyncio
     @patch("src.integrations.ibkr_gateway.IBKRConnection")
     async def test_disconnect(self, mock_connection_class, gateway_config, mock_risk_manager):
         """Test graceful disconnection."""
         # Mock connection
         mock_conn_instance = MagicMock()
-        mock_conn_instance.connect = AsyncMock(return_value=True)
-        mock_conn_instance.disconnect = AsyncMock()
-        mock_conn_instance.health_check = AsyncMock(return_value={"market_data_available": True})
+        mock_conn_instance.connect = MagicMock(return_value=True)
+        mock_conn_instance.disconnect = MagicMock()
         mock_connection_class.return_value = mock_conn_instance
 
         gateway = IBKRGateway(gateway_config, mock_risk_manager, mode=ExecutionMode.DRY_RUN)
@@ -127,7 +124,6 @@ class TestGatewayConnection:
         assert not gateway.is_connected
         mock_conn_instance.disconnect.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_operations_require_connection(self, gateway_config, mock_risk_manager):
         """Test that operations fail when not connected."""
         gateway = IBKRGateway(gateway_config, mock_risk_manager, mode=ExecutionMode.DRY_RUN)
@@ -146,7 +142,6 @@ class TestGatewayConnection:
 class TestAlphaLearningEnforcement:
     """Test alpha learning enforcement at gateway level."""
 
-    @pytest.mark.asyncio
     @patch("src.integrations.ibkr_gateway.IBKRConnection")
     async def test_historical_data_1_hour_limit_enforced(
         self, mock_connection_class, gateway_config, mock_risk_manager
@@ -154,8 +149,7 @@ class TestAlphaLearningEnforcement:
         """Test 1-hour historical data limit is enforced."""
         # Mock connection as connected
         mock_conn_instance = MagicMock()
-        mock_conn_instance.connect = AsyncMock(return_value=True)
-        mock_conn_instance.health_check = AsyncMock(return_value={"market_data_available": True})
+        mock_conn_instance.connect = MagicMock(return_value=True)
         mock_connection_class.return_value = mock_conn_instance
 
         gateway = IBKRGateway(gateway_config, mock_risk_manager, mode=ExecutionMode.DRY_RUN)
@@ -174,7 +168,6 @@ class TestAlphaLearningEnforcement:
 class TestGatewayOrchestration:
     """Test that gateway properly orchestrates all components."""
 
-    @pytest.mark.asyncio
     @patch("src.integrations.ibkr_gateway.IBKRConnection")
     async def test_gateway_delegates_to_pipeline(
         self, mock_connection_class, gateway_config, mock_risk_manager
@@ -182,8 +175,7 @@ class TestGatewayOrchestration:
         """Test that market data requests delegate to pipeline."""
         # Mock connection
         mock_conn_instance = MagicMock()
-        mock_conn_instance.connect = AsyncMock(return_value=True)
-        mock_conn_instance.health_check = AsyncMock(return_value={"market_data_available": True})
+        mock_conn_instance.connect = MagicMock(return_value=True)
         mock_connection_class.return_value = mock_conn_instance
 
         gateway = IBKRGateway(gateway_config, mock_risk_manager, mode=ExecutionMode.DRY_RUN)
@@ -191,19 +183,16 @@ class TestGatewayOrchestration:
 
         # Mock pipeline
         mock_pipeline = MagicMock()
-        mock_pipeline.fetch_market_data = AsyncMock(
-            return_value=MagicMock(symbol="SPY", last_price=450.0)
-        )
+        mock_pipeline.fetch_market_data = async_return(MagicMock(symbol="SPY", last_price=450.0))
         gateway._pipeline = mock_pipeline
 
         await gateway.connect()
         market_data = await gateway.get_market_data("SPY")
 
         # Verify pipeline was called
-        mock_pipeline.fetch_market_data.assert_called_once_with("SPY", timeout=30.0)
+        mock_pipeline.fetch_market_data.mock.assert_called_once_with("SPY", timeout=30.0)
         assert market_data.symbol == "SPY"
 
-    @pytest.mark.asyncio
     @patch("src.integrations.ibkr_gateway.IBKRConnection")
     async def test_gateway_delegates_to_executor(
         self, mock_connection_class, gateway_config, mock_risk_manager
@@ -214,8 +203,7 @@ class TestGatewayOrchestration:
 
         # Mock connection
         mock_conn_instance = MagicMock()
-        mock_conn_instance.connect = AsyncMock(return_value=True)
-        mock_conn_instance.health_check = AsyncMock(return_value={"market_data_available": True})
+        mock_conn_instance.connect = MagicMock(return_value=True)
         mock_connection_class.return_value = mock_conn_instance
 
         gateway = IBKRGateway(gateway_config, mock_risk_manager, mode=ExecutionMode.DRY_RUN)
@@ -225,8 +213,8 @@ class TestGatewayOrchestration:
         from src.integrations.order_executor import OrderResult, OrderStatus
 
         mock_executor = MagicMock()
-        mock_executor.execute = AsyncMock(
-            return_value=OrderResult(
+        mock_executor.execute = async_return(
+            OrderResult(
                 order_id="ORD_001",
                 status=OrderStatus.SIMULATED,
                 timestamp=datetime.now(timezone.utc),
@@ -249,10 +237,9 @@ class TestGatewayOrchestration:
         result = await gateway.submit_order(signal, context)
 
         # Verify executor was called
-        mock_executor.execute.assert_called_once()
+        mock_executor.execute.mock.assert_called_once()
         assert result.status == OrderStatus.SIMULATED
 
-    @pytest.mark.asyncio
     @patch("src.integrations.ibkr_gateway.IBKRConnection")
     async def test_gateway_delegates_to_position_manager(
         self, mock_connection_class, gateway_config, mock_risk_manager
@@ -260,8 +247,7 @@ class TestGatewayOrchestration:
         """Test that position queries delegate to position manager."""
         # Mock connection
         mock_conn_instance = MagicMock()
-        mock_conn_instance.connect = AsyncMock(return_value=True)
-        mock_conn_instance.health_check = AsyncMock(return_value={"market_data_available": True})
+        mock_conn_instance.connect = MagicMock(return_value=True)
         mock_connection_class.return_value = mock_conn_instance
 
         gateway = IBKRGateway(gateway_config, mock_risk_manager, mode=ExecutionMode.DRY_RUN)
@@ -269,12 +255,12 @@ class TestGatewayOrchestration:
 
         # Mock position manager
         mock_pos_manager = MagicMock()
-        mock_pos_manager.get_all = AsyncMock(return_value=[])
+        mock_pos_manager.get_all = async_return([])
         gateway._positions = mock_pos_manager
 
         await gateway.connect()
         positions = await gateway.get_positions()
 
         # Verify position manager was called
-        mock_pos_manager.get_all.assert_called_once_with(timeout=10.0)
+        mock_pos_manager.get_all.mock.assert_called_once_with(timeout=10.0)
         assert positions == []
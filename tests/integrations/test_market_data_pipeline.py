@@ -7,7 +7,7 @@ Tests marker data fetching, indicator calculation, and quality validation.
 import pytest
 import numpy as np
 from datetime import datetime, timezone, timedelta
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 from src.integrations.market_data_pipeline import (
     MarketDataPipeline,
@@ -16,36 +16,42 @@ from src.integrations.market_data_pipeline import (
     AlphaLearningViolationError,
 )
 
+# One hour of 1-min bars, built once; the pipeline only reads them
+_FAKE_BARS = [
+    {
+        "open": 450.0 + i * 0.1,
+        "high": 451.0 + i * 0.1,
+        "low": 449.0 + i * 0.1,
+        "close": 450.0 + i * 0.1,
+        "volume": 10000,
+    }
+    for i in range(60)
+]
+
 
 @pytest.fixture
 def mock_market_data_provider():
-    """Mock MarketDataProvider with snapshot=True enforcement."""
-    provider = MagicMock()
-    provider.request_market_data = MagicMock(
-        return_value={
-            "symbol": "SPY",
-            "last": 450.0,
-            "bid": 449.95,
-            "ask": 450.05,
-            "volume": 1000000,
-            "timestamp": datetime.now(timezone.utc),
-        }
+    """
+    Stub MarketDataProvider with snapshot=True enforcement.
+
+    The pipeline only calls these methods and no test asserts on the calls,
+    so a SimpleNamespace of plain callables stands in for a MagicMock.
+    """
+    quote = {
+        "symbol": "SPY",
+        "last": 450.0,
+        "bid": 449.95,
+        "ask": 450.05,
+        "volume": 1000000,
+        "timestamp": datetime.now(timezone.utc),
+    }
+    return SimpleNamespace(
+        request_market_data=lambda **_: quote,
+        request_historical_data=lambda **_: _FAKE_BARS,
+        contract_manager=SimpleNamespace(
+            qualify_contract=lambda symbol: SimpleNamespace(symbol=symbol)
+        ),
     )
-    provider.request_historical_data = MagicMock(
-        return_value=[
-            {
-                "open": 450.0 + i * 0.1,
-                "high": 451.0 + i * 0.1,
-                "low": 449.0 + i * 0.1,
-                "close": 450.0 + i * 0.1,
-                "volume": 10000,
-            }
-            for i in range(60)
-        ]
-    )
-    provider.contract_manager = MagicMock()
-    provider.contract_manager.qualify_contract = MagicMock(return_value=MagicMock(symbol="SPY"))
-    return provider
 
 
 @pytest.fixture
@@ -57,7 +63,6 @@ def pipeline(mock_market_data_provider):
 class TestMarketDataPipeline:
     """Test MarketDataPipeline functionality."""
 
-    @pytest.mark.asyncio
     async def test_fetch_market_data_success(self, pipeline, mock_market_data_provider):
         """Test successful market data fetch with indicators."""
         market_data = await pipeline.fetch_market_data("SPY", timeout=30.0)
@@ -74,7 +79,6 @@ class TestMarketDataPipeline:
         assert not market_data.is_stale
         assert market_data.data_quality_score > 0.5
 
-    @pytest.mark.asyncio
     async def test_alpha_learning_1_hour_limit_enforced(self, pipeline):
         """Test that historical data >60 minutes is rejected (alpha learning)."""
         with pytest.raises(AlphaLearningViolationError) as exc_info:
@@ -92,6 +96,16 @@ class TestMarketDataPipeline:
         assert ema > 100.0
         assert ema < 110.0
 
+    def test_calculate_ema_matches_recurrence(self, pipeline):
+        """Test vectorized EMA equals the bar-by-bar recurrence seeded at the first price."""
+        prices = np.array([100.0 + (i % 7) - 0.3 * i for i in range(60)])
+        multiplier = 2 / (21 + 1)
+        expected = prices[0]
+        for price in prices[1:]:
+            expected = price * multiplier + expected * (1 - multiplier)
+
+        assert pipeline._calculate_ema(prices, period=21) == pytest.approx(expected, rel=1e-12)
+
     def test_calculate_ema_insufficient_data(self, pipeline):
         """Test EMA calculation fails with insufficient data."""
         prices = np.array([100.0, 101.0, 102.0])
@@ -234,3 +248,30 @@ class TestMarketDataPipeline:
             pipeline._calculate_indicators(bars)
 
         assert "21 bars" in str(exc_info.value)
+
+    def test_calculate_indicators_missing_close(self, pipeline):
+        """Test a bar with a None close is rejected instead of becoming NaN."""
+        bars = [dict(bar) for bar in _FAKE_BARS]
+        bars[30]["close"] = None
+
+        with pytest.raises(InsufficientDataError) as exc_info:
+            pipeline._calculate_indicators(bars)
+
+        assert "Bar 30 has missing close" in str(exc_info.value)
+
+    def test_calculate_indicators_success(self, pipeline):
+        """Test full indicator set matches the individual reference calculations."""
+        bars = _FAKE_BARS
+        closes = np.array([b["close"] for b in bars])
+        highs = np.array([b["high"] for b in bars])
+        lows = np.array([b["low"] for b in bars])
+        volumes = np.array([b["volume"] for b in bars], dtype=float)
+
+        indicators = pipeline._calculate_indicators(bars)
+
+        recent = closes[-20:]
+        assert indicators.bollinger_middle == pytest.approx(recent.mean())
+        assert indicators.bollinger_upper == pytest.approx(recent.mean() + 2 * recent.std())
+        assert indicators.bollinger_lower == pytest.approx(recent.mean() - 2 * recent.std())
+        typical = (highs + lows + closes) / 3
+        assert indicators.vwap == pytest.approx((typical * volumes).sum() / volumes.sum())
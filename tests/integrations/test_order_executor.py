@@ -6,6 +6,7 @@ Tests order execution with risk validation, dry-run mode, and paper mode.
 
 import pytest
 from datetime import datetime, timezone
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import MagicMock
 from decimal import Decimal
 
@@ -14,33 +15,39 @@ from src.integrations.order_executor import (
     ExecutionMode,
     OrderStatus,
 )
+from src.risk.risk_types import RejectionReason
 from src.strategies.base import Signal, Direction, StrategyType
 
+# Completed trade handed back by the module-scoped placeOrder mock in paper-mode tests
+_DONE_TRADE = SimpleNamespace(isDone=lambda: True)
 
-@pytest.fixture
+
+# The collaborator mocks below are only read by these tests (no call or
+# return_value assertions), so one instance per module is enough.
+@pytest.fixture(scope="module")
 def mock_connection():
     """Mock IBKRConnection."""
     conn = MagicMock()
     conn.ib = MagicMock()
-    conn.ib.placeOrder = MagicMock(return_value=MagicMock(isDone=lambda: True))
+    conn.ib.placeOrder = MagicMock(return_value=_DONE_TRADE)
     return conn
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_contracts():
     """Mock ContractManager."""
     contracts = MagicMock()
-    contracts.qualify_contract = MagicMock(return_value=MagicMock(symbol="SPY"))
-    contracts.qualify_option_contract = MagicMock(return_value=MagicMock(symbol="SPY"))
+    contracts.qualify_contract = MagicMock(return_value=SimpleNamespace(symbol="SPY"))
+    contracts.qualify_option_contract = MagicMock(return_value=SimpleNamespace(symbol="SPY"))
     return contracts
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_risk_manager():
     """Mock RiskManager that approves all trades."""
     rm = MagicMock()
     rm.evaluate = MagicMock(
-        return_value=MagicMock(
+        return_value=SimpleNamespace(
             approved=True,
             rejections=[],
             approved_contracts=Decimal("1"),
@@ -50,14 +57,12 @@ def mock_risk_manager():
     return rm
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def rejecting_risk_manager():
     """Mock RiskManager that rejects all trades."""
-    from src.risk.risk_types import RejectionReason
-
     rm = MagicMock()
     rm.evaluate = MagicMock(
-        return_value=MagicMock(
+        return_value=SimpleNamespace(
             approved=False,
             rejections=[RejectionReason.PDT_LIMIT_REACHED],
             approved_contracts=Decimal("0"),
@@ -91,15 +96,15 @@ def executor_paper(mock_connection, mock_contracts, mock_risk_manager):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def buy_signal():
-    """Sample BUY signal."""
+    """Sample BUY signal (shared; no test mutates it)."""
     return Signal(
         direction=Direction.BUY,
         symbol="SPY",
         confidence=0.8,
         rationale="EMA crossover + RSI favorable",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=datetime(2025, 1, 1, 14, 30, tzinfo=timezone.utc),
         strategy_type=StrategyType.A,
         entry_price=450.0,
         stop_loss=440.0,
@@ -107,24 +112,25 @@ def buy_signal():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def strategy_context():
-    """Sample strategy context."""
-    return {
-        "strategy_id": "strategy_a",
-        "strategy_name": "momentum_breakout",
-        "quantity": 1,
-        "order_type": "MKT",
-        "risk_per_trade": 0.02,
-        "take_profit_pct": 0.20,
-        "stop_loss_pct": 0.25,
-    }
+    """Sample strategy context, read-only so the shared instance cannot drift."""
+    return MappingProxyType(
+        {
+            "strategy_id": "strategy_a",
+            "strategy_name": "momentum_breakout",
+            "quantity": 1,
+            "order_type": "MKT",
+            "risk_per_trade": 0.02,
+            "take_profit_pct": 0.20,
+            "stop_loss_pct": 0.25,
+        }
+    )
 
 
 class TestOrderExecutor:
     """Test OrderExecutor functionality."""
 
-    @pytest.mark.asyncio
     async def test_execute_dry_run_approved(self, executor_dry_run, buy_signal, strategy_context):
         """Test dry-run execution with approved trade."""
         result = await executor_dry_run.execute(buy_signal, strategy_context, timeout=30.0)
@@ -135,7 +141,6 @@ class TestOrderExecutor:
         assert result.fill_quantity == 1
         assert result.order_id.startswith("ORD_")
 
-    @pytest.mark.asyncio
     async def test_execute_rejected_by_risk_manager(
         self, mock_connection, mock_contracts, rejecting_risk_manager, buy_signal, strategy_context
     ):
@@ -153,8 +158,7 @@ class TestOrderExecutor:
         assert "PDT" in result.rejection_reason or "rejection" in result.rejection_reason.lower()
         assert result.risk_validation is not None
 
-    @pytest.mark.asyncio
-    async def test_build_trade_request(self, executor_dry_run, buy_signal, strategy_context):
+    def test_build_trade_request(self, executor_dry_run, buy_signal, strategy_context):
         """Test TradeRequest building from signal."""
         trade_request = executor_dry_run._build_trade_request(buy_signal, strategy_context)
 
@@ -165,15 +169,13 @@ class TestOrderExecutor:
         assert trade_request.limit_price == 450.0
         assert trade_request.operator_id == "CSATSPRIM"
 
-    @pytest.mark.asyncio
-    async def test_operator_id_enforcement(self, executor_dry_run, buy_signal, strategy_context):
+    def test_operator_id_enforcement(self, executor_dry_run, buy_signal, strategy_context):
         """Test operator ID is attached to all orders."""
         trade_request = executor_dry_run._build_trade_request(buy_signal, strategy_context)
 
         assert trade_request.operator_id == "CSATSPRIM"
 
-    @pytest.mark.asyncio
-    async def test_generate_unique_order_ids(self, executor_dry_run):
+    def test_generate_unique_order_ids(self, executor_dry_run):
         """Test order IDs are unique."""
         id1 = executor_dry_run._generate_order_id()
         id2 = executor_dry_run._generate_order_id()
@@ -198,7 +200,6 @@ class TestOrderExecutor:
 class TestRiskValidationEnforcement:
     """Test that risk validation cannot be bypassed."""
 
-    @pytest.mark.asyncio
     async def test_no_bypass_path_exists(self, executor_dry_run, buy_signal, strategy_context):
         """Test that all execution paths go through risk validation."""
         # Replace evaluate with a mock that tracks calls
@@ -5,15 +5,48 @@ Tests position tracking, P&L calculation, and Strategy C closure logic.
 """
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
+from src.integrations.order_executor import FillResult
 from src.integrations.position_manager import (
     PositionManager,
     Position,
     PositionNotFoundError,
 )
 
+# Trade returned for every closing order; only passed on to the stubbed _wait_for_fill
+_DONE_TRADE = SimpleNamespace(isDone=lambda: True)
+
+# Fill reported for every closing order; close() only reads it
+_FILLED = FillResult(filled=True, avg_fill_price=95.0, filled_quantity=10)
+
+
+async def _fill_immediately(trade, timeout):
+    """Stand-in for PositionManager._wait_for_fill."""
+    return _FILLED
+
+
+# Pinned "now" for DTE tests, so expiries are literals and never straddle midnight
+_FIXED_NOW = datetime(2025, 1, 6, 15, 0)
+_EXPIRY_3DTE = "20250109"
+_EXPIRY_10DTE = "20250116"
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns _FIXED_NOW."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return _FIXED_NOW if tz is None else _FIXED_NOW.replace(tzinfo=tz)
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Pin the position manager's clock to _FIXED_NOW."""
+    monkeypatch.setattr("src.integrations.position_manager.datetime", _FrozenDatetime)
+
 
 @pytest.fixture
 def mock_connection():
@@ -21,7 +54,7 @@ def mock_connection():
     conn = MagicMock()
     conn.ib = MagicMock()
     conn.ib.positions = MagicMock(return_value=[])
-    conn.ib.placeOrder = MagicMock(return_value=MagicMock(isDone=lambda: True))
+    conn.ib.placeOrder = MagicMock(return_value=_DONE_TRADE)
     return conn
 
 
@@ -41,52 +74,35 @@ def position_manager(mock_connection, mock_risk_manager):
 
 @pytest.fixture
 def mock_option_contract_3dte():
-    """Mock option contract with 3 days to expiration."""
-    contract = MagicMock()
-    contract.symbol = "SPY"
-    contract.conId = 12345
-    expiry_date = (datetime.now() + timedelta(days=3)).strftime("%Y%m%d")
-    contract.lastTradeDateOrContractMonth = expiry_date
-    return contract
-
-
-@pytest.fixture
-def mock_option_contract_10dte():
-    """Mock option contract with 10 days to expiration."""
-    contract = MagicMock()
-    contract.symbol = "SPY"
-    contract.conId = 12345
-    expiry_date = (datetime.now() + timedelta(days=10)).strftime("%Y%m%d")
-    contract.lastTradeDateOrContractMonth = expiry_date
-    return contract
+    """Stub option contract with 3 days to expiration."""
+    return SimpleNamespace(symbol="SPY", conId=12345, lastTradeDateOrContractMonth=_EXPIRY_3DTE)
 
 
 @pytest.fixture
 def mock_position_profitable():
-    """Mock profitable position."""
-    pos = MagicMock()
-    pos.contract = MagicMock(symbol="SPY", conId=12345)
-    pos.contract.lastTradeDateOrContractMonth = None  # Stock, not option
-    pos.position = 10  # Long 10 shares
-    pos.avgCost = 100.0  # Entry at $100
-    return pos
+    """Stub profitable position."""
+    return SimpleNamespace(
+        contract=SimpleNamespace(
+            symbol="SPY", conId=12345, lastTradeDateOrContractMonth=None  # Stock, not option
+        ),
+        position=10,  # Long 10 shares
+        avgCost=100.0,  # Entry at $100
+    )
 
 
 @pytest.fixture
 def mock_position_losing():
-    """Mock position with 45% loss."""
-    pos = MagicMock()
-    pos.contract = MagicMock(symbol="SPY", conId=12345)
-    pos.contract.lastTradeDateOrContractMonth = None
-    pos.position = 10
-    pos.avgCost = 100.0  # Entry at $100
-    return pos
+    """Stub position with 45% loss."""
+    return SimpleNamespace(
+        contract=SimpleNamespace(symbol="SPY", conId=12345, lastTradeDateOrContractMonth=None),
+        position=10,
+        avgCost=100.0,  # Entry at $100
+    )
 
 
 class TestPositionManager:
     """Test PositionManager functionality."""
 
-    @pytest.mark.asyncio
     async def test_get_all_empty(self, position_manager, mock_connection):
         """Test getting positions when none exist."""
         mock_connection.ib.positions.return_value = []
@@ -95,63 +111,56 @@ class TestPositionManager:
 
         assert len(positions) == 0
 
-    @pytest.mark.asyncio
-    async def test_calculate_dte_option(self, position_manager, mock_option_contract_3dte):
+    @pytest.mark.usefixtures("frozen_now")
+    def test_calculate_dte_option(self, position_manager, mock_option_contract_3dte):
         """Test DTE calculation for options."""
         dte = position_manager._calculate_dte(mock_option_contract_3dte)
 
         assert dte == 3
 
-    @pytest.mark.asyncio
-    async def test_calculate_dte_stock(self, position_manager):
+    def test_calculate_dte_stock(self, position_manager):
         """Test DTE calculation returns None for stocks."""
-        stock_contract = MagicMock(symbol="SPY")
-        delattr(stock_contract, "lastTradeDateOrContractMonth")
+        stock_contract = SimpleNamespace(symbol="SPY")  # No expiry attribute
 
         dte = position_manager._calculate_dte(stock_contract)
 
         assert dte is None
 
-    def test_determine_closure_trigger_3dte(self, position_manager):
-        """Test 3 DTE closure trigger."""
-        trigger = position_manager._determine_closure_trigger(
-            should_close_3_dte=True, should_close_emergency=False
-        )
-
-        assert trigger == "3_DTE_RULE"
-
-    def test_determine_closure_trigger_emergency(self, position_manager):
-        """Test 40% emergency stop trigger (takes priority)."""
-        trigger = position_manager._determine_closure_trigger(
-            should_close_3_dte=True, should_close_emergency=True
-        )
-
-        assert trigger == "EMERGENCY_STOP"  # Emergency takes priority
-
-    def test_determine_closure_trigger_none(self, position_manager):
-        """Test no closure trigger when all conditions false."""
+    @pytest.mark.parametrize(
+        "close_3_dte, close_emergency, expected",
+        [
+            (True, False, "3_DTE_RULE"),
+            (True, True, "EMERGENCY_STOP"),  # Emergency takes priority
+            (False, True, "EMERGENCY_STOP"),
+            (False, False, None),
+        ],
+    )
+    def test_determine_closure_trigger(
+        self, position_manager, close_3_dte, close_emergency, expected
+    ):
+        """Test closure trigger selection for each rule combination."""
         trigger = position_manager._determine_closure_trigger(
-            should_close_3_dte=False, should_close_emergency=False
+            should_close_3_dte=close_3_dte, should_close_emergency=close_emergency
         )
 
-        assert trigger is None
+        assert trigger == expected
 
-    @pytest.mark.asyncio
     async def test_close_position_not_found(self, position_manager):
         """Test closing non-existent position raises error."""
         with pytest.raises(PositionNotFoundError):
             await position_manager.close("INVALID_ID", reason="TEST")
 
-    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("frozen_now")
     async def test_check_strategy_c_closures(self, position_manager, mock_connection):
         """Test strategy C closure check."""
         # Mock position with 3 DTE
-        mock_pos = MagicMock()
-        mock_pos.contract = MagicMock(symbol="SPY", conId=12345)
-        expiry_date = (datetime.now() + timedelta(days=3)).strftime("%Y%m%d")
-        mock_pos.contract.lastTradeDateOrContractMonth = expiry_date
-        mock_pos.position = 10
-        mock_pos.avgCost = 100.0
+        mock_pos = SimpleNamespace(
+            contract=SimpleNamespace(
+                symbol="SPY", conId=12345, lastTradeDateOrContractMonth=_EXPIRY_3DTE
+            ),
+            position=10,
+            avgCost=100.0,
+        )
 
         mock_connection.ib.positions.return_value = [mock_pos]
 
@@ -168,34 +177,23 @@ class TestPositionManager:
 class TestStrategyC3DTERule:
     """Test Strategy C 3 DTE closure rule."""
 
-    @pytest.mark.asyncio
-    async def test_3_dte_triggers_closure(
-        self, position_manager, mock_connection, mock_option_contract_3dte
+    @pytest.mark.usefixtures("frozen_now")
+    @pytest.mark.parametrize(
+        "expiry_date, expect_close, expected_trigger",
+        [(_EXPIRY_3DTE, True, "3_DTE_RULE"), (_EXPIRY_10DTE, False, None)],
+        ids=["3dte", "10dte"],
+    )
+    async def test_dte_closure_flag(
+        self, position_manager, mock_connection, expiry_date, expect_close, expected_trigger
     ):
-        """Test that 3 DTE triggers closure flag."""
-        mock_pos = MagicMock()
-        mock_pos.contract = mock_option_contract_3dte
-        mock_pos.position = 10
-        mock_pos.avgCost = 100.0
-
-        mock_connection.ib.positions.return_value = [mock_pos]
-        position_manager._get_current_price = AsyncMock(return_value=102.0)
-
-        positions = await position_manager.get_all()
-
-        assert len(positions) == 1
-        assert positions[0].should_close_3_dte
-        assert positions[0].closure_trigger == "3_DTE_RULE"
-
-    @pytest.mark.asyncio
-    async def test_10_dte_no_closure(
-        self, position_manager, mock_connection, mock_option_contract_10dte
-    ):
-        """Test that 10 DTE does not trigger closure."""
-        mock_pos = MagicMock()
-        mock_pos.contract = mock_option_contract_10dte
-        mock_pos.position = 10
-        mock_pos.avgCost = 100.0
+        """Test that 3 DTE triggers closure and 10 DTE does not."""
+        mock_pos = SimpleNamespace(
+            contract=SimpleNamespace(
+                symbol="SPY", conId=12345, lastTradeDateOrContractMonth=expiry_date
+            ),
+            position=10,
+            avgCost=100.0,
+        )
 
         mock_connection.ib.positions.return_value = [mock_pos]
         position_manager._get_current_price = AsyncMock(return_value=102.0)
@@ -203,56 +201,52 @@ class TestStrategyC3DTERule:
         positions = await position_manager.get_all()
 
         assert len(positions) == 1
-        assert not positions[0].should_close_3_dte
+        assert positions[0].should_close_3_dte is expect_close
+        assert positions[0].closure_trigger == expected_trigger
 
 
 class TestStrategyC40PercentEmergencyStop:
     """Test Strategy C 40% emergency stop rule."""
 
-    @pytest.mark.asyncio
-    async def test_40_percent_loss_triggers_emergency(self, position_manager, mock_connection):
-        """Test that 40% loss triggers emergency closure."""
-        mock_pos = MagicMock()
-        mock_pos.contract = MagicMock(symbol="SPY", conId=12345)
-        mock_pos.contract.lastTradeDateOrContractMonth = None
-        mock_pos.position = 10
-        mock_pos.avgCost = 100.0  # Entry at $100
-
-        mock_connection.ib.positions.return_value = [mock_pos]
-        # Current price = $60, which is 40% loss
-        position_manager._get_current_price = AsyncMock(return_value=60.0)
-
-        positions = await position_manager.get_all()
-
-        assert len(positions) == 1
-        assert positions[0].should_close_emergency
-        assert positions[0].closure_trigger == "EMERGENCY_STOP"
-        assert positions[0].unrealized_pnl_pct <= -0.40
-
-    @pytest.mark.asyncio
-    async def test_30_percent_loss_no_emergency(self, position_manager, mock_connection):
-        """Test that 30% loss does not trigger emergency (threshold is 40%)."""
-        mock_pos = MagicMock()
-        mock_pos.contract = MagicMock(symbol="SPY", conId=12345)
-        mock_pos.contract.lastTradeDateOrContractMonth = None
-        mock_pos.position = 10
-        mock_pos.avgCost = 100.0
+    @pytest.mark.parametrize(
+        "current_price, expect_emergency",
+        [
+            (60.0, True),  # 40% loss
+            (70.0, False),  # 30% loss, below the 40% threshold
+        ],
+    )
+    async def test_emergency_stop_threshold(
+        self, position_manager, mock_connection, current_price, expect_emergency
+    ):
+        """Test that a 40% loss triggers emergency closure and 30% does not."""
+        mock_pos = SimpleNamespace(
+            contract=SimpleNamespace(symbol="SPY", conId=12345, lastTradeDateOrContractMonth=None),
+            position=10,
+            avgCost=100.0,  # Entry at $100
+        )
 
         mock_connection.ib.positions.return_value = [mock_pos]
-        # Current price = $70, which is 30% loss
-        position_manager._get_current_price = AsyncMock(return_value=70.0)
+        position_manager._get_current_price = AsyncMock(return_value=current_price)
 
         positions = await position_manager.get_all()
 
         assert len(positions) == 1
-        assert not positions[0].should_close_emergency
+        assert positions[0].should_close_emergency is expect_emergency
+        if expect_emergency:
+            assert positions[0].closure_trigger == "EMERGENCY_STOP"
+            assert positions[0].unrealized_pnl_pct <= -0.40
 
 
 class TestClosureReasonTracking:
     """Test that closure reasons are properly tracked for audit."""
 
-    @pytest.mark.asyncio
-    async def test_close_logs_reason(self, position_manager, mock_connection):
+    @pytest.fixture
+    def closing_manager(self, position_manager):
+        """PositionManager whose order fills complete immediately."""
+        position_manager._wait_for_fill = _fill_immediately
+        return position_manager
+
+    async def test_close_logs_reason(self, closing_manager, mock_connection):
         """Test that close() logs the closure reason."""
         # Create a cached position
         position = Position(
@@ -264,24 +258,16 @@ class TestClosureReasonTracking:
             unrealized_pnl=-50.0,
             unrealized_pnl_pct=-0.05,
             days_to_expiry=None,
-            contract=MagicMock(symbol="SPY", conId=12345),
+            contract=SimpleNamespace(symbol="SPY", conId=12345),
         )
-        position_manager._positions_cache["SPY_12345"] = position
+        closing_manager._positions_cache["SPY_12345"] = position
 
-        # Mock wait for fill
-        from src.integrations.order_executor import FillResult
-
-        position_manager._wait_for_fill = AsyncMock(
-            return_value=FillResult(filled=True, avg_fill_price=95.0, filled_quantity=10)
-        )
-
-        await position_manager.close("SPY_12345", reason="MANUAL", timeout=30.0)
+        await closing_manager.close("SPY_12345", reason="MANUAL", timeout=30.0)
 
         # Verify order was placed
         assert mock_connection.ib.placeOrder.called
 
-    @pytest.mark.asyncio
-    async def test_close_all_emergency_liquidation(self, position_manager, mock_connection):
+    async def test_close_all_emergency_liquidation(self, closing_manager, mock_connection):
         """Test close_all() emergency liquidation."""
         # Create two cached positions
         position1 = Position(
@@ -293,7 +279,7 @@ class TestClosureReasonTracking:
             unrealized_pnl=-50.0,
             unrealized_pnl_pct=-0.05,
             days_to_expiry=None,
-            contract=MagicMock(symbol="SPY", conId=12345),
+            contract=SimpleNamespace(symbol="SPY", conId=12345),
         )
         position2 = Position(
             position_id="QQQ_67890",
@@ -304,19 +290,12 @@ class TestClosureReasonTracking:
             unrealized_pnl=-50.0,
             unrealized_pnl_pct=-0.05,
             days_to_expiry=None,
-            contract=MagicMock(symbol="QQQ", conId=67890),
-        )
-        position_manager._positions_cache["SPY_12345"] = position1
-        position_manager._positions_cache["QQQ_67890"] = position2
-
-        # Mock wait for fill
-        from src.integrations.order_executor import FillResult
-
-        position_manager._wait_for_fill = AsyncMock(
-            return_value=FillResult(filled=True, avg_fill_price=95.0, filled_quantity=10)
+            contract=SimpleNamespace(symbol="QQQ", conId=67890),
         )
+        closing_manager._positions_cache["SPY_12345"] = position1
+        closing_manager._positions_cache["QQQ_67890"] = position2
 
-        results = await position_manager.close_all(reason="DAILY_LOSS_LIMIT", timeout=60.0)
+        results = await closing_manager.close_all(reason="DAILY_LOSS_LIMIT", timeout=60.0)
 
         # Verify both positions closed
         assert len(results) == 2
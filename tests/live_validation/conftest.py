@@ -4,12 +4,18 @@ Live Validation Test Fixtures
 Provides Gateway connection fixture for live validation testing against paper trading account.
 """
 
+import os
 from pathlib import Path
 from typing import Any, Generator, cast
 
 import pytest
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 # Note: These imports will need to be adjusted based on actual broker implementation
 # Placeholder imports for handoff implementation
 # from src.broker.ibkr_gateway import IBKRGateway
@@ -37,13 +43,13 @@ def live_validation_config() -> dict[str, Any]:
         )
 
     with open(config_path, "r") as f:
-        config = cast(dict[str, Any], yaml.safe_load(f))
+        config = cast(dict[str, Any], yaml.load(f, Loader=_YamlLoader))
 
     return config
 
 
 @pytest.fixture(scope="session")
-def live_gateway_connection(live_validation_config: dict[str, Any]) -> Generator[Any, None, None]:
+def live_gateway_connection(request: pytest.FixtureRequest) -> Generator[Any, None, None]:
     """
     Establishes connection to IBKR Gateway for live validation testing.
 
@@ -53,7 +59,8 @@ def live_gateway_connection(live_validation_config: dict[str, Any]) -> Generator
     - Market hours: 9:30 AM - 4:00 PM ET (or extended hours if configured)
 
     Args:
-        live_validation_config: Configuration dictionary from config file
+        request: Fixture request, used to load live_validation_config only
+            once a connection is actually attempted
 
     Yields:
         Gateway connection object for test session
@@ -78,7 +85,7 @@ def live_gateway_connection(live_validation_config: dict[str, Any]) -> Generator
 
     # Placeholder implementation structure (to be completed in Phase 2):
     """
-    config = live_validation_config
+    config = request.getfixturevalue("live_validation_config")
     gateway_config = config.get("gateway", {})
     paper_config = config.get("paper_trading", {})
 
@@ -137,6 +144,50 @@ def live_gateway_connection(live_validation_config: dict[str, Any]) -> Generator
     """
 
 
+def _qualify_stock(gateway: Any, symbol: str) -> Any:
+    """Create and qualify a SMART-routed USD stock contract."""
+    contract = gateway.create_contract(
+        symbol=symbol, sec_type="STK", exchange="SMART", currency="USD"
+    )
+    return gateway.qualify_contract(contract)
+
+
+@pytest.fixture(scope="session")
+def qualified_spy(live_gateway_connection: Any) -> Any:
+    """
+    SPY stock contract, qualified once per session.
+
+    The conId does not change within a session, so the market data tests
+    share this instead of each paying a Gateway qualification round-trip.
+
+    Args:
+        live_gateway_connection: Gateway fixture
+
+    Returns:
+        Qualified SPY contract
+    """
+    return _qualify_stock(live_gateway_connection, "SPY")
+
+
+@pytest.fixture(scope="session")
+def qualified_etfs(live_gateway_connection: Any, qualified_spy: Any) -> dict[str, Any]:
+    """
+    Qualified SPY, QQQ and IWM stock contracts keyed by symbol.
+
+    Args:
+        live_gateway_connection: Gateway fixture
+        qualified_spy: Session-cached SPY contract (reused, not re-qualified)
+
+    Returns:
+        dict: Symbol -> qualified contract
+    """
+    return {
+        "SPY": qualified_spy,
+        "QQQ": _qualify_stock(live_gateway_connection, "QQQ"),
+        "IWM": _qualify_stock(live_gateway_connection, "IWM"),
+    }
+
+
 @pytest.fixture(scope="function")
 def market_hours_check(live_validation_config: dict[str, Any]) -> None:
     """
@@ -189,6 +240,46 @@ def market_hours_check(live_validation_config: dict[str, Any]) -> None:
     pass
 
 
+# Timings used when IBKR_TEST_MODE=fast, in place of the config values
+_FAST_TIMINGS = {
+    "connection_stability_seconds": 5.0,
+    "stability_poll_interval_seconds": 0.1,
+    "reconnect_base_delay_seconds": 0.01,
+}
+
+_DEFAULT_TIMINGS = {
+    "connection_stability_seconds": 60.0,
+    "stability_poll_interval_seconds": 1.0,
+    "reconnect_base_delay_seconds": 1.0,
+}
+
+
+def _timing(live_validation_config: dict[str, Any], key: str) -> float:
+    """Resolve a validation timing, honouring IBKR_TEST_MODE=fast."""
+    if os.environ.get("IBKR_TEST_MODE") == "fast":
+        return _FAST_TIMINGS[key]
+    validation_config = live_validation_config.get("validation", {})
+    return float(validation_config.get(key, _DEFAULT_TIMINGS[key]))
+
+
+@pytest.fixture(scope="session")
+def stability_duration(live_validation_config: dict[str, Any]) -> float:
+    """Seconds to monitor the Gateway connection for stability."""
+    return _timing(live_validation_config, "connection_stability_seconds")
+
+
+@pytest.fixture(scope="session")
+def stability_interval(live_validation_config: dict[str, Any]) -> float:
+    """Initial seconds between stability polls (backs off to 10x while healthy)."""
+    return _timing(live_validation_config, "stability_poll_interval_seconds")
+
+
+@pytest.fixture(scope="session")
+def reconnect_base_delay(live_validation_config: dict[str, Any]) -> float:
+    """Seconds before the first reconnect attempt; doubles per attempt."""
+    return _timing(live_validation_config, "reconnect_base_delay_seconds")
+
+
 # Pytest markers for live validation
 def pytest_configure(config):
     """Register custom markers for live validation tests."""
@@ -144,7 +144,9 @@ def test_position_retrieval_empty_account(live_gateway_connection: Any) -> None:
 
 
 @pytest.mark.live
-def test_gateway_reconnection_resilience(live_gateway_connection: Any) -> None:
+def test_gateway_reconnection_resilience(
+    live_gateway_connection: Any, reconnect_base_delay: float
+) -> None:
     """
     Verify Gateway can recover from transient disconnection.
 
@@ -156,6 +158,7 @@ def test_gateway_reconnection_resilience(live_gateway_connection: Any) -> None:
 
     Args:
         live_gateway_connection: Gateway fixture from conftest
+        reconnect_base_delay: First backoff delay in seconds (IBKR_TEST_MODE aware)
 
     Expected:
         - Disconnect reduces is_connected() to False
@@ -180,7 +183,7 @@ def test_gateway_reconnection_resilience(live_gateway_connection: Any) -> None:
     connected = False
 
     for attempt in range(max_retries):
-        wait_time = 2**attempt  # 1s, 2s, 4s
+        wait_time = reconnect_base_delay * 2**attempt  # 1s, 2s, 4s by default
         time.sleep(wait_time)
 
         gateway.connect()
@@ -194,7 +197,9 @@ def test_gateway_reconnection_resilience(live_gateway_connection: Any) -> None:
 
 
 @pytest.mark.live
-def test_gateway_connection_stability(live_gateway_connection: Any) -> None:
+def test_gateway_connection_stability(
+    live_gateway_connection: Any, stability_duration: float, stability_interval: float
+) -> None:
     """
     Verify Gateway connection remains stable over extended duration.
 
@@ -205,6 +210,8 @@ def test_gateway_connection_stability(live_gateway_connection: Any) -> None:
 
     Args:
         live_gateway_connection: Gateway fixture from conftest
+        stability_duration: Monitoring window in seconds (60 by default)
+        stability_interval: Initial poll interval in seconds (IBKR_TEST_MODE aware)
 
     Expected:
         - is_connected() returns True after 60 seconds
@@ -220,16 +227,19 @@ def test_gateway_connection_stability(live_gateway_connection: Any) -> None:
     assert gateway.is_connected() is True
     assert gateway.is_authenticated() is True
 
-    # Monitor connection for 60 seconds
-    duration = 60  # seconds
-    check_interval = 5  # seconds
+    # Monitor connection for the window, backing off while it stays healthy
+    check_interval = stability_interval  # doubles after each healthy check
+    max_check_interval = 10 * stability_interval
+    start = time.monotonic()
+    deadline = start + stability_duration
 
-    for elapsed in range(0, duration, check_interval):
-        time.sleep(check_interval)
+    while (remaining := deadline - time.monotonic()) > 0:
+        time.sleep(min(check_interval, remaining))
 
         assert (
             gateway.is_connected() is True
-        ), f"Gateway disconnected unexpectedly after {elapsed + check_interval}s"
+        ), f"Gateway disconnected unexpectedly after {time.monotonic() - start:.0f}s"
+        check_interval = min(check_interval * 2, max_check_interval)
 
     # Final verification
     assert gateway.is_connected() is True
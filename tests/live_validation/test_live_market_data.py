@@ -15,15 +15,27 @@ import time
 from datetime import datetime, timezone
 from typing import Any
 
+import numpy as np
 import pytest
 
 # Note: These imports will be updated once broker layer is implemented
 # from src.broker.ibkr_gateway import Contract
 
 
+def _bars_to_arrays(bars: Any) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (closes, volumes, epoch-second timestamps) as float64 arrays."""
+    count = len(bars)
+    closes = np.fromiter((bar.close for bar in bars), dtype=np.float64, count=count)
+    volumes = np.fromiter((bar.volume for bar in bars), dtype=np.float64, count=count)
+    timestamps = np.fromiter(
+        (bar.timestamp.timestamp() for bar in bars), dtype=np.float64, count=count
+    )
+    return closes, volumes, timestamps
+
+
 @pytest.mark.live
 def test_market_data_subscription_spy(
-    live_gateway_connection: Any, market_hours_check: None
+    live_gateway_connection: Any, qualified_spy: Any, market_hours_check: None
 ) -> None:
     """
     Verify real-time market data subscription for SPY.
@@ -37,6 +49,7 @@ def test_market_data_subscription_spy(
 
     Args:
         live_gateway_connection: Gateway fixture from conftest
+        qualified_spy: Session-qualified SPY contract from conftest
         market_hours_check: Ensures test runs during market hours
 
     Expected:
@@ -51,12 +64,8 @@ def test_market_data_subscription_spy(
     """
     gateway = live_gateway_connection
 
-    # Qualify contract first (critical: prevents buffer overflow)
-    contract = gateway.create_contract(
-        symbol="SPY", sec_type="STK", exchange="SMART", currency="USD"
-    )
-
-    qualified_contract = gateway.qualify_contract(contract)
+    # Qualified before subscribing (critical: prevents buffer overflow)
+    qualified_contract = qualified_spy
     assert qualified_contract.conId > 0, "Valid contract ID should be assigned"
 
     # Subscribe to real-time quotes with snapshot=True (buffer overflow fix)
@@ -78,7 +87,7 @@ def test_market_data_subscription_spy(
 
 @pytest.mark.live
 def test_historical_data_retrieval_spy(
-    live_gateway_connection: Any, market_hours_check: None
+    live_gateway_connection: Any, qualified_spy: Any, market_hours_check: None
 ) -> None:
     """
     Verify historical data retrieval for backtesting/strategy logic.
@@ -92,6 +101,7 @@ def test_historical_data_retrieval_spy(
 
     Args:
         live_gateway_connection: Gateway fixture from conftest
+        qualified_spy: Session-qualified SPY contract from conftest
         market_hours_check: Ensures test runs during market hours
 
     Expected:
@@ -105,12 +115,7 @@ def test_historical_data_retrieval_spy(
         (max 1-hour RTH-only windows, max 1000 bars)
     """
     gateway = live_gateway_connection
-
-    contract = gateway.create_contract(
-        symbol="SPY", sec_type="STK", exchange="SMART", currency="USD"
-    )
-
-    qualified_contract = gateway.qualify_contract(contract)
+    qualified_contract = qualified_spy
 
     # Request 1 day of 5-minute bars (standard intraday data)
     bars = gateway.get_historical_data(
@@ -119,20 +124,23 @@ def test_historical_data_retrieval_spy(
 
     assert len(bars) > 0, "Historical bars should be returned"
 
-    # Verify all bars have valid OHLCV data
-    for i, bar in enumerate(bars):
-        assert bar.close > 0, f"Bar {i} close should be positive: {bar.close}"
-        assert bar.volume >= 0, f"Bar {i} volume should be non-negative: {bar.volume}"
-        assert bar.timestamp is not None, f"Bar {i} should have timestamp"
+    missing = [i for i, bar in enumerate(bars) if bar.timestamp is None]
+    assert not missing, f"Bar {missing[0]} should have timestamp"
+
+    # Verify all bars have valid OHLCV data (one array pass per field, up to 1000 bars)
+    closes, volumes, timestamps = _bars_to_arrays(bars)
+    bad = np.flatnonzero(closes <= 0)
+    assert bad.size == 0, f"Bar {bad[0]} close should be positive: {closes[bad[0]]}"
+    bad = np.flatnonzero(volumes < 0)
+    assert bad.size == 0, f"Bar {bad[0]} volume should be non-negative: {volumes[bad[0]]}"
 
     # Verify bars are in chronological order
-    timestamps = [bar.timestamp for bar in bars]
-    assert timestamps == sorted(timestamps), "Bars should be in chronological order"
+    assert np.all(np.diff(timestamps) >= 0), "Bars should be in chronological order"
 
 
 @pytest.mark.live
 def test_market_data_multiple_symbols(
-    live_gateway_connection: Any, market_hours_check: None
+    live_gateway_connection: Any, qualified_etfs: dict[str, Any], market_hours_check: None
 ) -> None:
     """
     Verify concurrent market data subscriptions (SPY, QQQ, IWM).
@@ -145,6 +153,7 @@ def test_market_data_multiple_symbols(
 
     Args:
         live_gateway_connection: Gateway fixture from conftest
+        qualified_etfs: Session-qualified SPY/QQQ/IWM contracts from conftest
         market_hours_check: Ensures test runs during market hours
 
     Expected:
@@ -160,12 +169,7 @@ def test_market_data_multiple_symbols(
 
     quotes = {}
     for symbol in symbols:
-        contract = gateway.create_contract(
-            symbol=symbol, sec_type="STK", exchange="SMART", currency="USD"
-        )
-
-        qualified_contract = gateway.qualify_contract(contract)
-        quotes[symbol] = gateway.get_market_data(qualified_contract, snapshot=True)
+        quotes[symbol] = gateway.get_market_data(qualified_etfs[symbol], snapshot=True)
 
     # Verify all quotes retrieved successfully
     for symbol in symbols:
@@ -176,7 +180,9 @@ def test_market_data_multiple_symbols(
 
 
 @pytest.mark.live
-def test_market_data_stream_quality(live_gateway_connection: Any, market_hours_check: None) -> None:
+def test_market_data_stream_quality(
+    live_gateway_connection: Any, qualified_spy: Any, market_hours_check: None
+) -> None:
     """
     Verify market data stream remains stable over 60 seconds.
 
@@ -188,6 +194,7 @@ def test_market_data_stream_quality(live_gateway_connection: Any, market_hours_c
 
     Args:
         live_gateway_connection: Gateway fixture from conftest
+        qualified_spy: Session-qualified SPY contract from conftest
         market_hours_check: Ensures test runs during market hours
 
     Expected:
@@ -200,26 +207,24 @@ def test_market_data_stream_quality(live_gateway_connection: Any, market_hours_c
         extended trading sessions (multi-hour endurance).
     """
     gateway = live_gateway_connection
-
-    contract = gateway.create_contract(
-        symbol="SPY", sec_type="STK", exchange="SMART", currency="USD"
-    )
-
-    qualified_contract = gateway.qualify_contract(contract)
+    qualified_contract = qualified_spy
 
     # Subscribe to streaming data
     gateway.subscribe_market_data(qualified_contract)
 
-    # Collect quotes for 60 seconds
+    # Collect quotes for 60 seconds on a fixed 1s schedule; sleeping until the
+    # next slot (rather than a flat 1s) keeps request latency from eating samples
     quotes_received = []
-    start_time = time.time()
-    check_interval = 1  # Check every second
+    check_interval = 1.0  # Check every second
+    next_check = time.monotonic()
+    deadline = next_check + 60
 
-    while time.time() - start_time < 60:
+    while next_check < deadline:
         quote = gateway.get_latest_quote(qualified_contract)
         if quote is not None:
             quotes_received.append(quote)
-        time.sleep(check_interval)
+        next_check += check_interval
+        time.sleep(max(0.0, next_check - time.monotonic()))
 
     # Cleanup: Unsubscribe from streaming data
     gateway.unsubscribe_market_data(qualified_contract)
@@ -239,7 +244,7 @@ def test_market_data_stream_quality(live_gateway_connection: Any, market_hours_c
 
 @pytest.mark.live
 def test_market_data_quote_freshness_validation(
-    live_gateway_connection: Any, market_hours_check: None
+    live_gateway_connection: Any, qualified_spy: Any, market_hours_check: None
 ) -> None:
     """
     Verify bot can detect and reject stale market data.
@@ -251,6 +256,7 @@ def test_market_data_quote_freshness_validation(
 
     Args:
         live_gateway_connection: Gateway fixture from conftest
+        qualified_spy: Session-qualified SPY contract from conftest
         market_hours_check: Ensures test runs during market hours
 
     Expected:
@@ -261,12 +267,7 @@ def test_market_data_quote_freshness_validation(
         Bot should NEVER trade on stale quotes (> 5s old).
     """
     gateway = live_gateway_connection
-
-    contract = gateway.create_contract(
-        symbol="SPY", sec_type="STK", exchange="SMART", currency="USD"
-    )
-
-    qualified_contract = gateway.qualify_contract(contract)
+    qualified_contract = qualified_spy
 
     # Get current quote
     quote = gateway.get_market_data(qualified_contract, snapshot=True)
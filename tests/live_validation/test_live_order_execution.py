@@ -14,7 +14,7 @@ Requirements:
 """
 
 import time
-from typing import Any
+from typing import Any, Container, Generator
 
 import pytest
 
@@ -22,9 +22,93 @@ import pytest
 # from src.broker.ibkr_gateway import Contract, Order
 
 
+def _wait_for_order_status(
+    gateway: Any, order_id: int, statuses: Container[str], timeout: float = 30.0
+) -> Any:
+    """
+    Poll an order until its status is in ``statuses`` or ``timeout`` elapses.
+
+    Polls every 0.1s at first, since paper fills usually land within a few
+    hundred milliseconds, then backs off to once a second for slow orders.
+
+    Returns:
+        The last order status observed
+    """
+    delay = 0.1
+    deadline = time.monotonic() + timeout
+    while True:
+        order_status = gateway.get_order_status(order_id)
+        remaining = deadline - time.monotonic()
+        if order_status.status in statuses or remaining <= 0:
+            return order_status
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 1.0)
+
+
+def _latest_quote(gateway: Any, contract: Any) -> Any:
+    """
+    Read the streamed quote for ``contract``, or take a snapshot if none has arrived.
+
+    The contract is subscribed once per module, so this is normally a local
+    read. A quiet deep-OTM strike may not tick for a while, but its last
+    streamed bid/ask is still the current one; quote freshness is covered
+    separately by test_market_data_staleness_detection.
+
+    Returns:
+        Quote with current bid/ask
+    """
+    quote = gateway.get_latest_quote(contract)
+    if quote is None:
+        quote = gateway.get_market_data(contract, snapshot=True)
+    return quote
+
+
+@pytest.fixture(autouse=True)
+def _cancel_open_orders(live_gateway_connection: Any) -> Generator[None, None, None]:
+    """
+    Cancel any orders a test left working so the next test starts clean.
+
+    The Gateway connection is shared by the whole session, so without this an
+    unfilled order from one test could fill during, or be counted by, the next.
+    """
+    yield
+    live_gateway_connection.cancel_all_orders()
+
+
+@pytest.fixture(scope="module")
+def spy_600c_qualified(live_gateway_connection: Any) -> Generator[Any, None, None]:
+    """
+    Deep OTM SPY 600C option contract, qualified and subscribed once per module.
+
+    Every order test trades this contract, so they share one qualification
+    round-trip and one streaming subscription. Tests read current prices with
+    _latest_quote instead of paying for a snapshot each time.
+
+    Args:
+        live_gateway_connection: Gateway fixture
+
+    Yields:
+        Qualified SPY option contract with streaming market data active
+    """
+    contract = live_gateway_connection.create_contract(
+        symbol="SPY",
+        sec_type="OPT",
+        exchange="SMART",
+        currency="USD",
+        last_trade_date="20260220",  # Weekly expiry (update as needed)
+        strike=600.0,  # Deep OTM for safety
+        right="CALL",
+    )
+    qualified_contract = live_gateway_connection.qualify_contract(contract)
+
+    live_gateway_connection.subscribe_market_data(qualified_contract)
+    yield qualified_contract
+    live_gateway_connection.unsubscribe_market_data(qualified_contract)
+
+
 @pytest.mark.live
 def test_paper_trading_limit_order_submission(
-    live_gateway_connection: Any, market_hours_check: None
+    live_gateway_connection: Any, spy_600c_qualified: Any, market_hours_check: None
 ) -> None:
     """
     Verify limit order submission to paper trading account.
@@ -37,6 +121,7 @@ def test_paper_trading_limit_order_submission(
 
     Args:
         live_gateway_connection: Gateway fixture from conftest
+        spy_600c_qualified: Module-qualified, streaming SPY 600C option contract
         market_hours_check: Ensures test runs during market hours
 
     Expected:
@@ -50,39 +135,19 @@ def test_paper_trading_limit_order_submission(
     """
     gateway = live_gateway_connection
 
-    # Qualify contract
-    contract = gateway.create_contract(
-        symbol="SPY",
-        sec_type="OPT",
-        exchange="SMART",
-        currency="USD",
-        last_trade_date="20260220",  # Weekly expiry (update as needed)
-        strike=600.0,  # Deep OTM for safety
-        right="CALL",
-    )
-
-    qualified_contract = gateway.qualify_contract(contract)
-
     # Get current market price
-    quote = gateway.get_market_data(qualified_contract, snapshot=True)
+    quote = _latest_quote(gateway, spy_600c_qualified)
 
     # Submit limit order at current bid (should fill immediately in paper trading)
     order = gateway.create_order(
         action="BUY", order_type="LMT", total_quantity=1, lmt_price=quote.bid, tif="DAY"
     )
 
-    order_id = gateway.place_order(qualified_contract, order)
+    order_id = gateway.place_order(spy_600c_qualified, order)
     assert order_id > 0, "Valid order ID should be returned"
 
     # Wait for order status updates (max 30 seconds)
-    order_status = None
-    timeout = 30
-
-    for _ in range(timeout):
-        order_status = gateway.get_order_status(order_id)
-        if order_status.status in ["Filled", "Cancelled"]:
-            break
-        time.sleep(1)
+    order_status = _wait_for_order_status(gateway, order_id, {"Filled", "Cancelled"})
 
     # In paper trading, limit orders at bid should fill quickly
     assert order_status is not None, "Order status should be retrievable"
@@ -96,7 +161,7 @@ def test_paper_trading_limit_order_submission(
 
 @pytest.mark.live
 def test_paper_trading_position_tracking(
-    live_gateway_connection: Any, market_hours_check: None
+    live_gateway_connection: Any, spy_600c_qualified: Any, market_hours_check: None
 ) -> None:
     """
     Verify position appears in account after order fill.
@@ -109,6 +174,7 @@ def test_paper_trading_position_tracking(
 
     Args:
         live_gateway_connection: Gateway fixture from conftest
+        spy_600c_qualified: Module-qualified, streaming SPY 600C option contract
         market_hours_check: Ensures test runs during market hours
 
     Expected:
@@ -123,31 +189,16 @@ def test_paper_trading_position_tracking(
     gateway = live_gateway_connection
 
     # Submit and fill an order
-    contract = gateway.create_contract(
-        symbol="SPY",
-        sec_type="OPT",
-        exchange="SMART",
-        currency="USD",
-        last_trade_date="20260220",  # Weekly expiry
-        strike=600.0,  # Deep OTM
-        right="CALL",
-    )
-
-    qualified_contract = gateway.qualify_contract(contract)
-    quote = gateway.get_market_data(qualified_contract, snapshot=True)
+    quote = _latest_quote(gateway, spy_600c_qualified)
 
     order = gateway.create_order(
         action="BUY", order_type="LMT", total_quantity=1, lmt_price=quote.bid, tif="DAY"
     )
 
-    order_id = gateway.place_order(qualified_contract, order)
+    order_id = gateway.place_order(spy_600c_qualified, order)
 
     # Wait for fill
-    for _ in range(30):
-        order_status = gateway.get_order_status(order_id)
-        if order_status.status == "Filled":
-            break
-        time.sleep(1)
+    order_status = _wait_for_order_status(gateway, order_id, {"Filled"})
 
     assert order_status.status == "Filled", "Order should fill before position check"
 
@@ -172,7 +223,7 @@ def test_paper_trading_position_tracking(
 
 @pytest.mark.live
 def test_paper_trading_order_cancellation(
-    live_gateway_connection: Any, market_hours_check: None
+    live_gateway_connection: Any, spy_600c_qualified: Any, market_hours_check: None
 ) -> None:
     """
     Verify order cancellation works correctly.
@@ -185,6 +236,7 @@ def test_paper_trading_order_cancellation(
 
     Args:
         live_gateway_connection: Gateway fixture from conftest
+        spy_600c_qualified: Module-qualified, streaming SPY 600C option contract
         market_hours_check: Ensures test runs during market hours
 
     Expected:
@@ -199,18 +251,7 @@ def test_paper_trading_order_cancellation(
     gateway = live_gateway_connection
 
     # Submit limit order far from market (won't fill)
-    contract = gateway.create_contract(
-        symbol="SPY",
-        sec_type="OPT",
-        exchange="SMART",
-        currency="USD",
-        last_trade_date="20260220",  # Weekly expiry
-        strike=600.0,  # Deep OTM
-        right="CALL",
-    )
-
-    qualified_contract = gateway.qualify_contract(contract)
-    quote = gateway.get_market_data(qualified_contract, snapshot=True)
+    quote = _latest_quote(gateway, spy_600c_qualified)
 
     order = gateway.create_order(
         action="BUY",
@@ -220,19 +261,22 @@ def test_paper_trading_order_cancellation(
         tif="DAY",
     )
 
-    order_id = gateway.place_order(qualified_contract, order)
-    time.sleep(2)  # Let order register
+    order_id = gateway.place_order(spy_600c_qualified, order)
+
+    # Let order register before cancelling (returns as soon as IBKR acks, max 5 seconds)
+    working_status = _wait_for_order_status(
+        gateway, order_id, {"PreSubmitted", "Submitted"}, timeout=5
+    )
+    assert working_status.status in (
+        "PreSubmitted",
+        "Submitted",
+    ), f"Order should be working before cancellation, found status: {working_status.status}"
 
     # Cancel order
     gateway.cancel_order(order_id)
 
     # Verify cancellation (max 10 seconds)
-    order_status = None
-    for _ in range(10):
-        order_status = gateway.get_order_status(order_id)
-        if order_status.status == "Cancelled":
-            break
-        time.sleep(1)
+    order_status = _wait_for_order_status(gateway, order_id, {"Cancelled"}, timeout=10)
 
     assert order_status is not None, "Order status should be retrievable"
     assert (
@@ -242,7 +286,7 @@ def test_paper_trading_order_cancellation(
 
 @pytest.mark.live
 def test_paper_trading_close_position(
-    live_gateway_connection: Any, market_hours_check: None
+    live_gateway_connection: Any, spy_600c_qualified: Any, market_hours_check: None
 ) -> None:
     """
     Verify position closing (sell to close) works correctly.
@@ -255,6 +299,7 @@ def test_paper_trading_close_position(
 
     Args:
         live_gateway_connection: Gateway fixture from conftest
+        spy_600c_qualified: Module-qualified, streaming SPY 600C option contract
         market_hours_check: Ensures test runs during market hours
 
     Expected:
@@ -269,40 +314,24 @@ def test_paper_trading_close_position(
     gateway = live_gateway_connection
 
     # Step 1: Establish a position (buy order)
-    contract = gateway.create_contract(
-        symbol="SPY",
-        sec_type="OPT",
-        exchange="SMART",
-        currency="USD",
-        last_trade_date="20260220",  # Weekly expiry
-        strike=600.0,  # Deep OTM
-        right="CALL",
-    )
-
-    qualified_contract = gateway.qualify_contract(contract)
-    quote = gateway.get_market_data(qualified_contract, snapshot=True)
+    quote = _latest_quote(gateway, spy_600c_qualified)
 
     # Buy order
     buy_order = gateway.create_order(
         action="BUY", order_type="LMT", total_quantity=1, lmt_price=quote.bid, tif="DAY"
     )
 
-    buy_order_id = gateway.place_order(qualified_contract, buy_order)
+    buy_order_id = gateway.place_order(spy_600c_qualified, buy_order)
 
     # Wait for buy fill
-    buy_status = None
-    for _ in range(30):
-        buy_status = gateway.get_order_status(buy_order_id)
-        if buy_status.status == "Filled":
-            break
-        time.sleep(1)
+    buy_status = _wait_for_order_status(gateway, buy_order_id, {"Filled"})
 
     assert buy_status is not None, "Buy order status should be retrievable"
     assert buy_status.status == "Filled", "Buy order should fill"
 
     # Step 2: Close the position (sell order)
     # Get fresh quote for sell price
-    quote = gateway.get_market_data(qualified_contract, snapshot=True)
+    quote = _latest_quote(gateway, spy_600c_qualified)
 
     sell_order = gateway.create_order(
         action="SELL",
@@ -312,15 +341,10 @@ def test_paper_trading_close_position(
         tif="DAY",
     )
 
-    sell_order_id = gateway.place_order(qualified_contract, sell_order)
+    sell_order_id = gateway.place_order(spy_600c_qualified, sell_order)
 
     # Wait for sell fill
-    sell_status = None
-    for _ in range(30):
-        sell_status = gateway.get_order_status(sell_order_id)
-        if sell_status.status == "Filled":
-            break
-        time.sleep(1)
+    sell_status = _wait_for_order_status(gateway, sell_order_id, {"Filled"})
 
     assert sell_status is not None, "Sell order status should be retrievable"
     assert sell_status.status == "Filled", "Sell order should fill"
@@ -341,7 +365,7 @@ def test_paper_trading_close_position(
 
 @pytest.mark.live
 def test_paper_trading_multiple_orders(
-    live_gateway_connection: Any, market_hours_check: None
+    live_gateway_connection: Any, spy_600c_qualified: Any, market_hours_check: None
 ) -> None:
     """
     Verify multiple orders can be placed and tracked simultaneously.
@@ -353,6 +377,7 @@ def test_paper_trading_multiple_orders(
 
     Args:
         live_gateway_connection: Gateway fixture from conftest
+        spy_600c_qualified: Module-qualified, streaming SPY 600C option contract
         market_hours_check: Ensures test runs during market hours
 
     Expected:
@@ -365,18 +390,7 @@ def test_paper_trading_multiple_orders(
     """
     gateway = live_gateway_connection
 
-    contract = gateway.create_contract(
-        symbol="SPY",
-        sec_type="OPT",
-        exchange="SMART",
-        currency="USD",
-        last_trade_date="20260220",  # Weekly expiry
-        strike=600.0,  # Deep OTM
-        right="CALL",
-    )
-
-    qualified_contract = gateway.qualify_contract(contract)
-    quote = gateway.get_market_data(qualified_contract, snapshot=True)
+    quote = _latest_quote(gateway, spy_600c_qualified)
 
     # Submit 3 orders with different prices (test independent tracking)
     order_ids = []
@@ -390,7 +404,7 @@ def test_paper_trading_multiple_orders(
             tif="DAY",
         )
 
-        order_id = gateway.place_order(qualified_contract, order)
+        order_id = gateway.place_order(spy_600c_qualified, order)
         order_ids.append(order_id)
 
     # Verify all order IDs are unique
@@ -401,6 +415,4 @@ def test_paper_trading_multiple_orders(
         order_status = gateway.get_order_status(order_id)
         assert order_status is not None, f"Order {order_id} should be trackable"
 
-    # Cleanup: Cancel all orders
-    for order_id in order_ids:
-        gateway.cancel_order(order_id)
+    # Working orders are cancelled by the _cancel_open_orders fixture
@@ -13,10 +13,13 @@ Requirements:
 - Manual execution required
 """
 
+import random
+import re
 import time
 from datetime import datetime, timezone
 from typing import Any
 
+import numpy as np
 import pytest
 
 # Note: These imports will be updated once broker layer is implemented
@@ -39,6 +42,14 @@ except ImportError:
         pass
 
 
+# A quote older than this during RTH is treated as stale by the validation tests
+_FRESH_QUOTE_MAX_AGE_SECONDS = 5.0
+
+# Expected error-message classes, matched case-insensitively without lowercasing copies
+_CONTRACT_ERROR_RE = re.compile(r"not found|invalid", re.IGNORECASE)
+_QUANTITY_ERROR_RE = re.compile(r"quantity|invalid", re.IGNORECASE)
+
+
 @pytest.mark.live
 def test_network_timeout_handling(live_gateway_connection: Any) -> None:
     """
@@ -88,7 +99,7 @@ def test_network_timeout_handling(live_gateway_connection: Any) -> None:
 
 
 @pytest.mark.live
-def test_api_rate_limit_handling(live_gateway_connection: Any) -> None:
+def test_api_rate_limit_handling(live_gateway_connection: Any, qualified_spy: Any) -> None:
     """
     Verify exponential backoff on API rate limit errors.
 
@@ -100,6 +111,7 @@ def test_api_rate_limit_handling(live_gateway_connection: Any) -> None:
 
     Args:
         live_gateway_connection: Gateway fixture from conftest
+        qualified_spy: Session-qualified SPY contract
 
     Expected:
         - Some successful requests despite rapid-fire attempts
@@ -112,25 +124,21 @@ def test_api_rate_limit_handling(live_gateway_connection: Any) -> None:
     """
     gateway = live_gateway_connection
 
-    contract = gateway.create_contract(
-        symbol="SPY", sec_type="STK", exchange="SMART", currency="USD"
-    )
-
-    qualified_contract = gateway.qualify_contract(contract)
-
     # Rapid-fire requests to trigger rate limiting
     successful_requests = 0
     rate_limit_errors = 0
 
     for i in range(20):
         try:
-            quote = gateway.get_market_data(qualified_contract, snapshot=True)
+            quote = gateway.get_market_data(qualified_spy, snapshot=True)
             if quote is not None:
                 successful_requests += 1
         except RateLimitError:
             rate_limit_errors += 1
-            # Apply exponential backoff (max 8 second backoff)
-            time.sleep(2 ** min(rate_limit_errors, 3))
+            # Apply exponential backoff (max 8 second backoff) with equal jitter,
+            # the same shape as IBKRConnection._retry_delay
+            capped = min(2.0**rate_limit_errors, 8.0)
+            time.sleep(capped / 2 + random.uniform(0, capped / 2))
         except Exception:
             # Other errors are acceptable in this stress test
             pass
@@ -145,7 +153,7 @@ def test_api_rate_limit_handling(live_gateway_connection: Any) -> None:
 
 
 @pytest.mark.live
-def test_market_data_staleness_detection(live_gateway_connection: Any) -> None:
+def test_market_data_staleness_detection(live_gateway_connection: Any, qualified_spy: Any) -> None:
     """
     Verify bot detects and handles stale market data correctly.
 
@@ -156,6 +164,7 @@ def test_market_data_staleness_detection(live_gateway_connection: Any) -> None:
 
     Args:
         live_gateway_connection: Gateway fixture from conftest
+        qualified_spy: Session-qualified SPY contract
 
     Expected:
         - During market hours: quote age < 5 seconds
@@ -167,30 +176,25 @@ def test_market_data_staleness_detection(live_gateway_connection: Any) -> None:
     """
     gateway = live_gateway_connection
 
-    contract = gateway.create_contract(
-        symbol="SPY", sec_type="STK", exchange="SMART", currency="USD"
-    )
-
-    qualified_contract = gateway.qualify_contract(contract)
-
     # Get current quote
-    quote = gateway.get_market_data(qualified_contract, snapshot=True)
+    quote = gateway.get_market_data(qualified_spy, snapshot=True)
 
-    # Check timestamp freshness
-    quote_age = datetime.now(timezone.utc) - quote.timestamp
+    # Check timestamp freshness. quote.timestamp is exchange wall-clock time,
+    # so it must be compared against the wall clock, not time.monotonic().
+    quote_age_seconds = (datetime.now(timezone.utc) - quote.timestamp).total_seconds()
 
     # During market hours, quotes should be < 5 seconds old
     # Outside market hours, this test documents expected staleness
     # Bot should detect staleness and skip trading
-    if quote_age.total_seconds() < 5:
+    if quote_age_seconds < _FRESH_QUOTE_MAX_AGE_SECONDS:
         # Fresh quote (market hours)
         pass  # Expected during RTH
     else:
         # Stale quote (outside market hours or data delay)
         # Bot should NOT trade on this data
-        assert quote_age.total_seconds() > 5, (
+        assert quote_age_seconds > _FRESH_QUOTE_MAX_AGE_SECONDS, (
             "Stale quote detected. Bot should skip trading on stale data. "
-            f"Quote age: {quote_age.total_seconds():.2f}s"
+            f"Quote age: {quote_age_seconds:.2f}s"
         )
 
 
@@ -231,10 +235,7 @@ def test_gateway_error_recovery(live_gateway_connection: Any) -> None:
         # Should raise ContractNotFoundError or similar
     except Exception as e:
         # Error expected — verify it's handled gracefully
-        error_message = str(e).lower()
-        assert (
-            "not found" in error_message or "invalid" in error_message
-        ), f"Expected contract error, found: {e}"
+        assert _CONTRACT_ERROR_RE.search(str(e)), f"Expected contract error, found: {e}"
         error_caught = True
 
     assert error_caught is True, "Invalid contract should raise error"
@@ -293,15 +294,19 @@ def test_concurrent_request_handling(live_gateway_connection: Any) -> None:
         quotes[symbol] = gateway.get_market_data(contract, snapshot=True)
 
     # Verify all operations succeeded
-    for symbol in symbols:
-        assert quotes[symbol] is not None, f"{symbol} quote should be retrievable"
-        assert (
-            quotes[symbol].last_price > 0
-        ), f"{symbol} should have valid price: {quotes[symbol].last_price}"
+    missing = [symbol for symbol in symbols if quotes[symbol] is None]
+    assert not missing, f"{missing[0]} quote should be retrievable"
+
+    # One array comparison regardless of how many symbols are monitored
+    prices = np.fromiter(
+        (quotes[symbol].last_price for symbol in symbols), dtype=np.float64, count=len(symbols)
+    )
+    bad = np.flatnonzero(~(prices > 0))  # Also catches NaN prices
+    assert bad.size == 0, f"{symbols[bad[0]]} should have valid price: {prices[bad[0]]}"
 
 
 @pytest.mark.live
-def test_extended_session_stability(live_gateway_connection: Any) -> None:
+def test_extended_session_stability(live_gateway_connection: Any, qualified_spy: Any) -> None:
     """
     Verify Gateway connection remains stable over extended duration.
 
@@ -313,6 +318,7 @@ def test_extended_session_stability(live_gateway_connection: Any) -> None:
 
     Args:
         live_gateway_connection: Gateway fixture from conftest
+        qualified_spy: Session-qualified SPY contract
 
     Expected:
         - Gateway remains connected for full duration
@@ -324,36 +330,36 @@ def test_extended_session_stability(live_gateway_connection: Any) -> None:
     """
     gateway = live_gateway_connection
 
-    contract = gateway.create_contract(
-        symbol="SPY", sec_type="STK", exchange="SMART", currency="USD"
-    )
-
-    qualified_contract = gateway.qualify_contract(contract)
-
-    # Monitor connection for 5 minutes (300 seconds)
+    # Monitor connection for 5 minutes (300 seconds). is_connected() only reads
+    # local socket state, so check it often; a quote snapshot is a Gateway
+    # round-trip, so one per minute is enough to prove operations still work.
     duration = 300  # 5 minutes
-    check_interval = 30  # Check every 30 seconds
+    connection_check_interval = 10  # seconds
+    quote_interval = 60  # seconds
 
+    start = time.monotonic()
+    deadline = start + duration
+    next_quote = start + quote_interval
     checks_passed = 0
 
-    for elapsed in range(0, duration, check_interval):
-        time.sleep(check_interval)
+    while (remaining := deadline - time.monotonic()) > 0:
+        time.sleep(min(connection_check_interval, remaining))
+        elapsed = time.monotonic() - start
 
         # Verify connection
-        assert (
-            gateway.is_connected() is True
-        ), f"Gateway disconnected at {elapsed + check_interval}s"
+        assert gateway.is_connected() is True, f"Gateway disconnected at {elapsed:.0f}s"
 
         # Verify operations work
-        quote = gateway.get_market_data(qualified_contract, snapshot=True)
-        assert quote is not None, f"Quote retrieval failed at {elapsed + check_interval}s"
-
-        checks_passed += 1
+        if time.monotonic() >= next_quote:
+            quote = gateway.get_market_data(qualified_spy, snapshot=True)
+            assert quote is not None, f"Quote retrieval failed at {elapsed:.0f}s"
+            checks_passed += 1
+            next_quote += quote_interval
 
     # Final verification
     assert gateway.is_connected() is True
     assert (
-        checks_passed == duration // check_interval
+        checks_passed == duration // quote_interval
     ), f"Should pass all checks, passed: {checks_passed}"
 
 
@@ -412,9 +418,7 @@ def test_invalid_order_rejection(live_gateway_connection: Any, market_hours_chec
     except Exception as e:
         error_caught = True
         # Verify error is descriptive
-        assert (
-            "quantity" in str(e).lower() or "invalid" in str(e).lower()
-        ), f"Expected quantity error, found: {e}"
+        assert _QUANTITY_ERROR_RE.search(str(e)), f"Expected quantity error, found: {e}"
 
     assert error_caught is True, "Invalid order should be rejected"
 
@@ -7,25 +7,55 @@ Tests cover:
 - Graceful degradation without webhook
 """
 
-from unittest.mock import MagicMock, patch
+import json
+from contextlib import contextmanager
+from typing import Callable, Iterator, List
 
 import httpx
 import pytest
 
 from src.notifications.discord import DiscordNotifier
 
+WEBHOOK_URL = "https://discord.com/api/webhooks/test"
+
 # =============================================================================
 # FIXTURES
 # =============================================================================
 
 
+@contextmanager
+def _notifier(handler: Callable[[httpx.Request], httpx.Response]) -> Iterator[DiscordNotifier]:
+    """Create notifier whose requests are answered by handler instead of Discord.
+
+    The test owns the injected client, so it is closed here on exit.
+    """
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        yield DiscordNotifier(webhook_url=WEBHOOK_URL, timeout=5.0, client=client)
+
+
+@pytest.fixture(scope="session")
+def notifier_with_webhook() -> Iterator[DiscordNotifier]:
+    """Create notifier with webhook configured; Discord answers 204 No Content."""
+    with _notifier(lambda request: httpx.Response(204)) as notifier:
+        yield notifier
+
+
 @pytest.fixture
-def notifier_with_webhook() -> DiscordNotifier:
-    """Create notifier with webhook configured."""
-    return DiscordNotifier(
-        webhook_url="https://discord.com/api/webhooks/test",
-        timeout=5.0,
-    )
+def sent_requests() -> List[httpx.Request]:
+    """Requests captured by recording_notifier."""
+    return []
+
+
+@pytest.fixture
+def recording_notifier(sent_requests: List[httpx.Request]) -> Iterator[DiscordNotifier]:
+    """Create notifier that records every request it sends."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_requests.append(request)
+        return httpx.Response(204)
+
+    with _notifier(handler) as notifier:
+        yield notifier
 
 
 @pytest.fixture
@@ -42,65 +72,53 @@ def notifier_without_webhook() -> DiscordNotifier:
 class TestMessageSending:
     """Test message sending at different levels."""
 
-    @patch("httpx.Client")
-    def test_send_info_success(
+    @pytest.mark.parametrize(
+        "method, message",
+        [
+            ("send_info", "Test info"),
+            ("send_warning", "Test warning"),
+            ("send_error", "Test error"),
+            ("send_critical", "Test critical"),
+        ],
+    )
+    def test_send_success(
         self,
-        mock_client: MagicMock,
         notifier_with_webhook: DiscordNotifier,
+        method: str,
+        message: str,
     ) -> None:
-        """Info message is sent successfully."""
-        mock_response = MagicMock()
-        mock_response.raise_for_status = MagicMock()
-        mock_client.return_value.__enter__.return_value.post.return_value = mock_response
-
-        result = notifier_with_webhook.send_info("Test info")
+        """Message at each level is sent successfully."""
+        result = getattr(notifier_with_webhook, method)(message)
 
         assert result is True
 
-    @patch("httpx.Client")
-    def test_send_warning_success(
-        self,
-        mock_client: MagicMock,
-        notifier_with_webhook: DiscordNotifier,
-    ) -> None:
-        """Warning message is sent successfully."""
-        mock_response = MagicMock()
-        mock_response.raise_for_status = MagicMock()
-        mock_client.return_value.__enter__.return_value.post.return_value = mock_response
+    def test_default_client_is_reused(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without an injected client, one client is built and reused for every alert."""
+        real_client = httpx.Client
+        clients: List[httpx.Client] = []
 
-        result = notifier_with_webhook.send_warning("Test warning")
+        def build_client(timeout: float) -> httpx.Client:
+            client = real_client(
+                timeout=timeout, transport=httpx.MockTransport(lambda request: httpx.Response(204))
+            )
+            clients.append(client)
+            return client
 
-        assert result is True
+        monkeypatch.setattr(httpx, "Client", build_client)
 
-    @patch("httpx.Client")
-    def test_send_error_success(
-        self,
-        mock_client: MagicMock,
-        notifier_with_webhook: DiscordNotifier,
-    ) -> None:
-        """Error message is sent successfully."""
-        mock_response = MagicMock()
-        mock_response.raise_for_status = MagicMock()
-        mock_client.return_value.__enter__.return_value.post.return_value = mock_response
+        with DiscordNotifier(webhook_url=WEBHOOK_URL, timeout=5.0) as notifier:
+            assert notifier.send_info("Test info") is True
+            assert notifier.send_critical("Test critical") is True
 
-        result = notifier_with_webhook.send_error("Test error")
-
-        assert result is True
-
-    @patch("httpx.Client")
-    def test_send_critical_success(
-        self,
-        mock_client: MagicMock,
-        notifier_with_webhook: DiscordNotifier,
-    ) -> None:
-        """Critical message is sent successfully."""
-        mock_response = MagicMock()
-        mock_response.raise_for_status = MagicMock()
-        mock_client.return_value.__enter__.return_value.post.return_value = mock_response
+        assert len(clients) == 1
+        assert clients[0].is_closed
 
-        result = notifier_with_webhook.send_critical("Test critical")
+    def test_close_leaves_injected_client_open(self) -> None:
+        """close() only releases a client the notifier created itself."""
+        with httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(204))) as client:
+            DiscordNotifier(webhook_url=WEBHOOK_URL, client=client).close()
 
-        assert result is True
+            assert not client.is_closed
 
 
 # =============================================================================
@@ -111,58 +129,28 @@ class TestMessageSending:
 class TestErrorHandling:
     """Test webhook error handling."""
 
-    @patch("httpx.Client")
-    def test_http_error_returns_false(
-        self,
-        mock_client: MagicMock,
-        notifier_with_webhook: DiscordNotifier,
-    ) -> None:
+    def test_http_error_returns_false(self) -> None:
         """HTTP error returns False without raising."""
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Bad Request",
-            request=MagicMock(),
-            response=mock_response,
-        )
-        mock_client.return_value.__enter__.return_value.post.return_value = mock_response
-
-        result = notifier_with_webhook.send_info("Test")
+        with _notifier(lambda request: httpx.Response(400)) as notifier:
+            result = notifier.send_info("Test")
 
         assert result is False
 
-    @patch("httpx.Client")
-    def test_request_error_returns_false(
-        self,
-        mock_client: MagicMock,
-        notifier_with_webhook: DiscordNotifier,
-    ) -> None:
+    def test_request_error_returns_false(self) -> None:
         """Request error returns False without raising."""
-        mock_client.return_value.__enter__.return_value.post.side_effect = httpx.RequestError(
-            "Connection failed"
-        )
 
-        result = notifier_with_webhook.send_info("Test")
+        def refuse(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("Connection failed", request=request)
+
+        with _notifier(refuse) as notifier:
+            result = notifier.send_info("Test")
 
         assert result is False
 
-    @patch("httpx.Client")
-    def test_rate_limit_returns_false(
-        self,
-        mock_client: MagicMock,
-        notifier_with_webhook: DiscordNotifier,
-    ) -> None:
+    def test_rate_limit_returns_false(self) -> None:
         """Rate limit (429) returns False."""
-        mock_response = MagicMock()
-        mock_response.status_code = 429
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Rate Limited",
-            request=MagicMock(),
-            response=mock_response,
-        )
-        mock_client.return_value.__enter__.return_value.post.return_value = mock_response
-
-        result = notifier_with_webhook.send_info("Test")
+        with _notifier(lambda request: httpx.Response(429)) as notifier:
+            result = notifier.send_info("Test")
 
         assert result is False
 
@@ -184,6 +172,16 @@ class TestGracefulDegradation:
 
         assert result is False
 
+    def test_no_webhook_opens_no_client(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Log-only mode never builds an HTTP client."""
+        clients: List[object] = []
+        monkeypatch.setattr(httpx, "Client", lambda **kwargs: clients.append(kwargs))
+
+        with DiscordNotifier(webhook_url=None) as notifier:
+            assert notifier.send_info("Test") is False
+
+        assert clients == []
+
     def test_no_webhook_all_levels(
         self,
         notifier_without_webhook: DiscordNotifier,
@@ -203,22 +201,19 @@ class TestGracefulDegradation:
 class TestPayloadFormat:
     """Test Discord embed payload format."""
 
-    @patch("httpx.Client")
     def test_embed_includes_required_fields(
         self,
-        mock_client: MagicMock,
-        notifier_with_webhook: DiscordNotifier,
+        recording_notifier: DiscordNotifier,
+        sent_requests: List[httpx.Request],
     ) -> None:
         """Embed includes title, description, color, timestamp, footer."""
-        mock_response = MagicMock()
-        mock_response.raise_for_status = MagicMock()
-        mock_post = mock_client.return_value.__enter__.return_value.post
-        mock_post.return_value = mock_response
-
-        notifier_with_webhook.send_info("Test message")
+        recording_notifier.send_info("Test message")
 
-        call_args = mock_post.call_args
-        payload = call_args[1]["json"]
+        assert len(sent_requests) == 1
+        assert sent_requests[0].method == "POST"
+        assert str(sent_requests[0].url) == WEBHOOK_URL
+        assert sent_requests[0].headers["Content-Type"] == "application/json"
+        payload = json.loads(sent_requests[0].content)
 
         # Verify payload structure
         assert "embeds" in payload
@@ -229,36 +224,24 @@ class TestPayloadFormat:
         assert "timestamp" in embed
         assert "footer" in embed
 
-    @patch("httpx.Client")
-    def test_info_color_is_blue(
-        self,
-        mock_client: MagicMock,
-        notifier_with_webhook: DiscordNotifier,
-    ) -> None:
-        """Info level uses blue color."""
-        mock_response = MagicMock()
-        mock_response.raise_for_status = MagicMock()
-        mock_post = mock_client.return_value.__enter__.return_value.post
-        mock_post.return_value = mock_response
-
-        notifier_with_webhook.send_info("Test")
-
-        payload = mock_post.call_args[1]["json"]
-        assert payload["embeds"][0]["color"] == 3447003  # Blue
-
-    @patch("httpx.Client")
-    def test_critical_color_is_dark_red(
+    @pytest.mark.parametrize(
+        "method, color",
+        [
+            ("send_info", 3447003),  # Blue
+            ("send_warning", 16776960),  # Yellow
+            ("send_error", 16711680),  # Red
+            ("send_critical", 10038562),  # Dark red
+        ],
+    )
+    def test_level_color(
         self,
-        mock_client: MagicMock,
-        notifier_with_webhook: DiscordNotifier,
+        recording_notifier: DiscordNotifier,
+        sent_requests: List[httpx.Request],
+        method: str,
+        color: int,
     ) -> None:
-        """Critical level uses dark red color."""
-        mock_response = MagicMock()
-        mock_response.raise_for_status = MagicMock()
-        mock_post = mock_client.return_value.__enter__.return_value.post
-        mock_post.return_value = mock_response
-
-        notifier_with_webhook.send_critical("Test")
+        """Each level uses its severity color."""
+        getattr(recording_notifier, method)("Test")
 
-        payload = mock_post.call_args[1]["json"]
-        assert payload["embeds"][0]["color"] == 10038562  # Dark red
+        payload = json.loads(sent_requests[0].content)
+        assert payload["embeds"][0]["color"] == color
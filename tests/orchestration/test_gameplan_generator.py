@@ -280,3 +280,12 @@ class TestGameplanLoading:
         result = load_gameplan_json(gameplan_path)
 
         assert result == gameplan
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Generated Strategy C gameplan loads back unchanged."""
+        output_path = tmp_path / "strategy_c.json"
+
+        generated = generate_strategy_c(output_path)
+        result = load_gameplan_json(output_path)
+
+        assert result == generated
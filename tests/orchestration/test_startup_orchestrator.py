@@ -245,6 +245,87 @@ class TestGatewayWaiting:
         assert orchestrator.context.state == StartupState.FAILURE
         assert "restart failed" in (orchestrator.context.error_message or "")
 
+    @patch("time.sleep")
+    @patch.object(StartupOrchestrator, "_check_docker_health", return_value=True)
+    @patch(
+        "src.orchestration.startup.GatewayHealthChecker.check_api_port",
+        side_effect=[False, False, False, False, False, False, False, True],
+    )
+    def test_gateway_polling_backs_off_exponentially(
+        self,
+        mock_port: MagicMock,
+        mock_docker: MagicMock,
+        mock_sleep: MagicMock,
+        orchestrator: StartupOrchestrator,
+    ) -> None:
+        """Poll delay starts small, doubles, and caps at the retry interval."""
+        orchestrator._wait_for_gateway()
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == [0.05, 0.1, 0.2, 0.4, 0.8, 1, 1]
+        assert orchestrator.context.state == StartupState.GATEWAY_VALIDATED
+
+    @patch("time.sleep")
+    @patch.object(StartupOrchestrator, "_check_docker_health", return_value=False)
+    @patch.object(StartupOrchestrator, "_restart_gateway")
+    @patch(
+        "src.orchestration.startup.GatewayHealthChecker.check_api_port",
+        return_value=False,
+    )
+    def test_zero_retry_interval_still_times_out(
+        self,
+        mock_port: MagicMock,
+        mock_restart: MagicMock,
+        mock_docker: MagicMock,
+        mock_sleep: MagicMock,
+        orchestrator: StartupOrchestrator,
+    ) -> None:
+        """A retry interval of 0 is clamped, so the timeout budget is still exhausted."""
+        orchestrator.config.gateway_health_retry_interval = 0
+        orchestrator.context.gateway_restart_attempted = True
+
+        orchestrator._wait_for_gateway()
+
+        assert orchestrator.context.state == StartupState.FAILURE
+        assert all(c.args[0] >= 0.05 for c in mock_sleep.call_args_list)
+
+    @patch("time.sleep")
+    @patch.object(StartupOrchestrator, "_check_docker_health", return_value=True)
+    @patch(
+        "src.orchestration.startup.GatewayHealthChecker.check_api_port",
+        side_effect=[False, False, True],
+    )
+    def test_docker_health_not_rechecked_once_healthy(
+        self,
+        mock_port: MagicMock,
+        mock_docker: MagicMock,
+        mock_sleep: MagicMock,
+        orchestrator: StartupOrchestrator,
+    ) -> None:
+        """Docker health is inspected once; later polls only probe the API port."""
+        orchestrator._wait_for_gateway()
+
+        assert mock_port.call_count == 3
+        mock_docker.assert_called_once()
+        assert orchestrator.context.state == StartupState.GATEWAY_VALIDATED
+
+    @pytest.mark.parametrize(
+        ("stdout", "expected"),
+        [(b"healthy\n", True), (b"unhealthy\n", False), (b"starting\n", False), (b"", False)],
+    )
+    @patch("subprocess.run")
+    def test_docker_health_parses_inspect_bytes(
+        self,
+        mock_run: MagicMock,
+        stdout: bytes,
+        expected: bool,
+        orchestrator: StartupOrchestrator,
+    ) -> None:
+        """Only an exact 'healthy' status counts — 'unhealthy' must not match."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=stdout)
+
+        assert orchestrator._check_docker_health() is expected
+
 
 # =============================================================================
 # GATEWAY VALIDATION
@@ -545,6 +626,19 @@ class TestFullRun:
 
         assert exit_code == 1
 
+    @patch.object(StartupOrchestrator, "_initialize", side_effect=RuntimeError("boom"))
+    def test_run_closes_notifier(
+        self,
+        mock_init: MagicMock,
+        orchestrator: StartupOrchestrator,
+    ) -> None:
+        """Notifier is closed when run() returns, even after a crash."""
+        with patch.object(orchestrator.notifier, "close") as mock_close:
+            exit_code = orchestrator.run()
+
+        assert exit_code == 1
+        mock_close.assert_called_once()
+
     @patch.object(StartupOrchestrator, "_start_bot")
     @patch.object(StartupOrchestrator, "_load_gameplan")
     @patch.object(StartupOrchestrator, "_validate_gateway")
@@ -133,6 +133,25 @@ class TestBrokerConnection:
             # Assert: Tried max_retries times
             assert mock_ib.connect.call_count == 3
 
+    def test_retry_delay_is_jittered_and_capped(self) -> None:
+        """Test backoff delays double per attempt, stay under the cap, and are jittered.
+
+        GIVEN: Connection with base delay 1s and a 3s cap
+        WHEN: Backoff delays are computed for successive attempts
+        THEN: Each delay lies between half and all of min(base * 2^n, cap)
+        """
+        # Arrange
+        connection = IBKRConnection(retry_delay_base=1.0, retry_delay_max=3.0)
+
+        # Act
+        delays = [connection._retry_delay(attempt) for attempt in range(4) for _ in range(50)]
+
+        # Assert: bounds per attempt are [0.5, 1], [1, 2], [1.5, 3], [1.5, 3]
+        for index, delay in enumerate(delays):
+            capped = min(2 ** (index // 50), 3.0)
+            assert capped / 2 <= delay <= capped
+        assert len(set(delays[:50])) > 1, "Delays should be jittered"
+
     def test_connection_cleanup_on_disconnect(self) -> None:
         """Test clean disconnect and resource cleanup.
 
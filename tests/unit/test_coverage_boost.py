@@ -291,6 +291,51 @@ class TestContractsCoverageBoost:
         result = manager.qualify_contract("SPY")
         assert result.conId == 756733
 
+    def test_qualify_contracts_batches_uncached_symbols(self) -> None:
+        """Batch qualification sends uncached symbols in one call and caches them."""
+        connection = IBKRConnection()
+        manager = ContractManager(connection)
+
+        cached_contract = Stock("SPY", "SMART", "USD")
+        cached_contract.conId = 756733
+        manager._qualified_cache["SPY_STK_SMART_USD"] = cached_contract
+
+        with patch.object(connection, "_ib") as mock_ib:
+            mock_ib.isConnected.return_value = True
+
+            def qualify(*contracts: Contract) -> list[Contract]:
+                for con_id, contract in enumerate(contracts, start=1):
+                    contract.conId = con_id
+                return list(contracts)
+
+            mock_ib.qualifyContracts.side_effect = qualify
+
+            result = manager.qualify_contracts(["QQQ", "SPY", "IWM", "QQQ"])
+
+            mock_ib.qualifyContracts.assert_called_once()
+            sent = [c.symbol for c in mock_ib.qualifyContracts.call_args.args]
+            assert sent == ["QQQ", "IWM"]
+            assert list(result) == ["QQQ", "SPY", "IWM"]
+            assert result["SPY"] is cached_contract
+            assert manager._qualified_cache["IWM_STK_SMART_USD"] is result["IWM"]
+
+    def test_qualify_contracts_reports_unqualified_symbols(self) -> None:
+        """Batch qualification raises naming the symbols that got no conId."""
+        connection = IBKRConnection()
+        manager = ContractManager(connection)
+
+        with patch.object(connection, "_ib") as mock_ib:
+            mock_ib.isConnected.return_value = True
+
+            good = Stock("SPY", "SMART", "USD")
+            good.conId = 756733
+            mock_ib.qualifyContracts.return_value = [good]
+
+            with pytest.raises(ContractQualificationError, match="FAKE"):
+                manager.qualify_contracts(["SPY", "FAKE"])
+
+            assert "SPY_STK_SMART_USD" in manager._qualified_cache
+
     def test_is_qualified_none_contract(self) -> None:
         """Cover: is_qualified with None contract."""
         connection = IBKRConnection()
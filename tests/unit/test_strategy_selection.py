@@ -229,6 +229,12 @@ class TestVIXRegimeDetection:
         result = detect_regime(None)
         assert result == "crisis"
 
+    def test_nan_vix_defaults_to_crisis(self):
+        """NaN VIX (corrupt feed) must fall through to crisis, never a tradeable regime."""
+        from src.strategy.selection import detect_regime
+
+        assert detect_regime(float("nan")) == "crisis"
+
 
 # =============================================================================
 # STRATEGY SELECTION TESTS
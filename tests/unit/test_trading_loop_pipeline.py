@@ -14,6 +14,7 @@ Outcomes tested:
   submitted             — all gates pass, dry_run=False, order placed
   error (market data)   — MarketDataProvider raises MarketDataError
   monitoring-only       — no pipeline providers supplied
+  prequalification      — cycle symbols qualified in one batched call
 """
 
 import json
@@ -24,7 +25,8 @@ from typing import Any, Dict, List
 from unittest.mock import MagicMock, patch
 
 from src.bot.trading_loop import TradingLoop
-from src.broker.exceptions import MarketDataError
+from src.broker.contracts import ContractManager
+from src.broker.exceptions import ContractQualificationError, MarketDataError
 from src.config.risk_config import DEFAULT_RISK_CONFIG, RiskConfig
 from src.strategies.base import Direction, Signal, StrategyType
 
@@ -525,6 +527,68 @@ class TestPipelineMonitoringOnly:
         assert loop._pipeline_ready() is True
 
 
+# =============================================================================
+# Batched contract qualification
+# =============================================================================
+
+
+class TestPrequalifySymbols:
+    """Cycle symbols are qualified in one batch before the per-symbol pipeline."""
+
+    @pytest.mark.unit
+    def test_batch_warms_per_symbol_qualification(
+        self,
+        gameplan: Dict[str, Any],
+        risk_config: RiskConfig,
+        mock_health_checker: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        connection = MagicMock()
+
+        def qualify(*contracts: Any) -> List[Any]:
+            for con_id, contract in enumerate(contracts, start=1):
+                contract.conId = con_id
+            return list(contracts)
+
+        connection.ib.qualifyContracts.side_effect = qualify
+        contract_manager = ContractManager(connection)
+        loop = _build_loop(
+            gameplan,
+            risk_config,
+            mock_health_checker,
+            contract_manager=contract_manager,
+            tmp_path=tmp_path,
+        )
+
+        loop._prequalify_symbols(["QQQ", "SPY"])
+        contract_manager.qualify_contract("QQQ")
+        contract_manager.qualify_contract("SPY")
+
+        connection.ib.qualifyContracts.assert_called_once()
+
+    @pytest.mark.unit
+    def test_batch_failure_is_not_raised(
+        self,
+        gameplan: Dict[str, Any],
+        risk_config: RiskConfig,
+        mock_health_checker: MagicMock,
+        mock_contract_manager: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        mock_contract_manager.qualify_contracts.side_effect = ContractQualificationError("FAKE")
+        loop = _build_loop(
+            gameplan,
+            risk_config,
+            mock_health_checker,
+            contract_manager=mock_contract_manager,
+            tmp_path=tmp_path,
+        )
+
+        loop._prequalify_symbols(["QQQ", "FAKE"])
+
+        mock_contract_manager.qualify_contracts.assert_called_once_with(["QQQ", "FAKE"])
+
+
 # =============================================================================
 # Position sizing helpers
 # =============================================================================